@@ -1,10 +1,17 @@
+import time
+
+# Chronométrage du démarrage (avant les imports lourds)
+_import_started_at = time.perf_counter()
+
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 import json
+import os
+import threading
 from datetime import datetime, timedelta
-from jow_api import Jow
 import logging
-import time
+from pantry import PantryView, USE_SOON_DAYS
+from shopping import aggregate_needs, compute_deficit, parse_request
 
 # Configuration du logging
 logging.basicConfig(level=logging.INFO)
@@ -13,8 +20,9 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)  # Permettre les requêtes CORS depuis le frontend React
 
-# Instance de l'API Jow - initialisation lazy
+# Instance de l'API Jow - initialisation lazy (jow_api est importé au premier appel)
 jow = None
+jow_lock = threading.Lock()
 
 # Cache en mémoire pour les recettes
 recipe_cache = {
@@ -23,13 +31,50 @@ recipe_cache = {
     'ttl': 300  # 5 minutes de cache
 }
 
+# Garde-manger persistant et vue matérialisée des recettes cuisinables
+PANTRY_FILE = os.environ.get('PANTRY_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pantry.json'))
+pantry_view = PantryView(PANTRY_FILE)
+
+# Construction du catalogue dans un thread dédié : les appelants attendent avec un délai
+# borné, car jow-api n'impose aucun timeout à ses requêtes HTTP. L'attente par défaut
+# reste sous le timeout de 15 s du frontend pour que le 503 lui parvienne
+catalog_build = {
+    'thread': None,
+    'started_at': None
+}
+catalog_build_lock = threading.Lock()
+CATALOG_WAIT_SECONDS = float(os.environ.get('CATALOG_WAIT_SECONDS', 10))
+CATALOG_BUILD_TIMEOUT = float(os.environ.get('CATALOG_BUILD_TIMEOUT', 180))
+
+# Warm-up au démarrage (optionnel) ou déclenché par la sonde de readiness, borné dans le temps
+WARMUP_ON_BOOT = os.environ.get('WARMUP_ON_BOOT', 'False').lower() == 'true'
+WARMUP_BUDGET_SECONDS = float(os.environ.get('WARMUP_BUDGET_SECONDS', 60))
+warmup_thread = None
+warmup_lock = threading.Lock()
+
+# Mesures de démarrage exposées par les endpoints de santé
+startup_metrics = {
+    'import_seconds': None,
+    'jow_init_seconds': None,
+    'warmup': {
+        'status': 'disabled',
+        'duration_seconds': None,
+        'recipes_count': 0
+    }
+}
+
 def get_jow():
     """Initialise Jow API si nécessaire"""
     global jow
     if jow is None:
-        logger.info("Initializing Jow API...")
-        jow = Jow()
-        logger.info("Jow API initialized successfully!")
+        with jow_lock:
+            if jow is None:
+                logger.info("Initializing Jow API...")
+                started_at = time.perf_counter()
+                from jow_api import Jow
+                jow = Jow()
+                startup_metrics['jow_init_seconds'] = round(time.perf_counter() - started_at, 3)
+                logger.info(f"Jow API initialized successfully in {startup_metrics['jow_init_seconds']}s!")
     return jow
 
 def is_cache_valid():
@@ -52,24 +97,246 @@ def cache_recipes(recipes):
     recipe_cache['data'] = recipes
     recipe_cache['timestamp'] = time.time()
     logger.info(f"Cached {len(recipes)} recipes")
+    pantry_view.set_recipes(recipes)
 
-@app.route('/health', methods=['GET'])
-def health_check():
-    """Point de santé de l'API avec informations sur le cache"""
+def is_catalog_warm():
+    """Vérifie si le catalogue a été chargé au moins une fois"""
+    return bool(recipe_cache['data'])
+
+def get_cache_info():
+    """Informations sur le cache pour les endpoints de santé"""
     cache_status = "valid" if is_cache_valid() else "expired"
     cache_size = len(recipe_cache['data']) if recipe_cache['data'] else 0
-    
+    return {
+        "status": cache_status,
+        "recipes_count": cache_size,
+        "ttl": recipe_cache['ttl']
+    }
+
+@app.route('/health', methods=['GET'])
+@app.route('/health/live', methods=['GET'])
+def health_check():
+    """Liveness : le processus répond, sans toucher à l'API Jow"""
     return jsonify({
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "service": "Food Planner API",
-        "cache": {
-            "status": cache_status,
-            "recipes_count": cache_size,
-            "ttl": recipe_cache['ttl']
-        }
+        "cache": get_cache_info(),
+        "startup": startup_metrics
     })
 
+@app.route('/health/ready', methods=['GET'])
+def readiness_check():
+    """Readiness : prêt uniquement une fois le catalogue chargé
+
+    Tant que le catalogue est froid, chaque sonde (re)lance un warm-up en
+    arrière-plan si aucun n'est en cours : le pod finit toujours par devenir prêt,
+    même sans WARMUP_ON_BOOT ou après un warm-up en échec.
+    """
+    ready = is_catalog_warm()
+    if not ready:
+        start_warm_up()
+
+    return jsonify({
+        "status": "ready" if ready else "warming_up",
+        "ready": ready,
+        "timestamp": datetime.now().isoformat(),
+        "service": "Food Planner API",
+        "cache": get_cache_info(),
+        "startup": startup_metrics
+    }), 200 if ready else 503
+
+def format_recipe(recipe, fallback_id):
+    """Transforme une recette Jow au format attendu par le frontend"""
+    formatted_ingredients = []
+    ingredient_details = []
+    if hasattr(recipe, 'ingredients') and recipe.ingredients:
+        for ing in recipe.ingredients:
+            if hasattr(ing, 'name'):
+                formatted_ingredients.append(ing.name)
+                # Quantités par couvert, utilisées pour la liste de courses
+                ingredient_details.append({
+                    "name": ing.name,
+                    "quantity": getattr(ing, 'quantity', None) or 0,
+                    "unit": getattr(ing, 'unit', None) or "",
+                    "isOptional": bool(getattr(ing, 'isOptional', False))
+                })
+
+    return {
+        "id": str(recipe.id) if hasattr(recipe, 'id') else fallback_id,
+        "name": recipe.name if hasattr(recipe, 'name') else "Recette sans nom",
+        "description": recipe.description if hasattr(recipe, 'description') else "Délicieuse recette",
+        "ingredients": formatted_ingredients,
+        "ingredientDetails": ingredient_details,
+        "instructions": "Consultez le site Jow pour les instructions détaillées",
+        "prepTime": recipe.preparationTime if hasattr(recipe, 'preparationTime') else 30,
+        "difficulty": "medium",  # par défaut
+        "image": recipe.imageUrl if hasattr(recipe, 'imageUrl') else None,
+        "cookingTime": recipe.cookingTime if hasattr(recipe, 'cookingTime') else 0,
+        "coversCount": 2  # Toujours pour 2 personnes
+    }
+
+def format_recipes(recipes_data):
+    """Formate une liste de recettes Jow en ignorant celles qui échouent"""
+    formatted_recipes = []
+
+    if recipes_data and isinstance(recipes_data, list):
+        for recipe in recipes_data:
+            try:
+                formatted_recipes.append(format_recipe(recipe, str(len(formatted_recipes))))
+            except Exception as e:
+                logger.warning(f"Error formatting recipe: {e}")
+                continue
+
+    return formatted_recipes
+
+def build_catalog(deadline=None):
+    """Crawl le catalogue générique de recettes et le met en cache
+
+    Si `deadline` (time.monotonic()) est fourni, le crawl s'arrête entre deux
+    termes de recherche une fois l'échéance dépassée.
+    """
+    jow_api = get_jow()
+
+    # Stratégie optimisée : moins de termes, plus ciblés
+    search_terms = [
+        'poulet', 'bœuf', 'poisson', 'pâtes', 'riz', 'salade', 
+        'légumes', 'dessert', 'soupe', 'gratin'
+    ]
+    all_recipes = {}
+    recipes_per_term = 15  # Limite réduite par terme pour éviter les timeouts
+
+    for i, term in enumerate(search_terms):
+        if deadline is not None and time.monotonic() >= deadline:
+            logger.info(f"Time budget exhausted after {i}/{len(search_terms)} terms, stopping search")
+            break
+
+        try:
+            logger.info(f"Searching for '{term}' ({i+1}/{len(search_terms)})")
+            term_recipes = jow_api.search(to_search=term, limit=recipes_per_term)
+            
+            if term_recipes:
+                for recipe in term_recipes:
+                    recipe_id = str(recipe.id) if hasattr(recipe, 'id') else f"{term}_{len(all_recipes)}"
+                    if recipe_id not in all_recipes:
+                        all_recipes[recipe_id] = recipe
+                        
+            # Limiter à 100 recettes max pour éviter les timeouts
+            if len(all_recipes) >= 100:
+                logger.info("Reached 100 recipes limit, stopping search")
+                break
+                
+        except Exception as e:
+            logger.warning(f"Error searching for term '{term}': {e}")
+            continue
+
+    recipes_data = list(all_recipes.values())
+    logger.info(f"Fetched {len(recipes_data)} unique recipes from {len(search_terms)} terms")
+
+    formatted_recipes = format_recipes(recipes_data)
+    if formatted_recipes:
+        cache_recipes(formatted_recipes)
+    return formatted_recipes
+
+def is_catalog_building():
+    """Vérifie si un crawl du catalogue est en cours (et pas abandonné)"""
+    thread = catalog_build['thread']
+    return (thread is not None and thread.is_alive()
+            and time.monotonic() - catalog_build['started_at'] < CATALOG_BUILD_TIMEOUT)
+
+def run_catalog_build(deadline):
+    """Corps du thread de construction du catalogue"""
+    try:
+        build_catalog(deadline=deadline)
+    except Exception as e:
+        logger.error(f"Catalog build failed: {e}")
+
+def start_catalog_build(deadline=None):
+    """Lance un crawl en arrière-plan, ou retourne celui déjà en cours"""
+    with catalog_build_lock:
+        if is_catalog_building():
+            return catalog_build['thread']
+
+        previous = catalog_build['thread']
+        if previous is not None and previous.is_alive():
+            # Une recherche Jow bloquée ne doit pas empêcher toute reconstruction
+            logger.warning(f"Catalog build running for more than {CATALOG_BUILD_TIMEOUT}s, starting a new one")
+
+        thread = threading.Thread(target=run_catalog_build, args=(deadline,), name='catalog-build', daemon=True)
+        catalog_build['thread'] = thread
+        catalog_build['started_at'] = time.monotonic()
+        thread.start()
+        return thread
+
+def get_catalog(wait_seconds=None):
+    """Retourne le catalogue et indique s'il vient du cache
+
+    Un catalogue expiré est servi tel quel pendant sa reconstruction en
+    arrière-plan. Sans catalogue, attend au plus `wait_seconds` (par défaut
+    CATALOG_WAIT_SECONDS) le crawl puis lève TimeoutError.
+    """
+    cached_recipes = get_cached_recipes()
+    if cached_recipes:
+        return cached_recipes, True
+
+    if recipe_cache['data']:
+        logger.info("Cache expired - serving stale recipes while rebuilding")
+        start_catalog_build()
+        return recipe_cache['data'], True
+
+    logger.info("Cache miss - fetching new recipes from Jow API")
+    start_catalog_build().join(CATALOG_WAIT_SECONDS if wait_seconds is None else wait_seconds)
+
+    if recipe_cache['data']:
+        return recipe_cache['data'], False
+    raise TimeoutError("Recipe catalog is not available yet")
+
+def warm_up_catalog(budget_seconds=None):
+    """Précharge le catalogue dans la limite du budget de temps
+
+    Le budget borne l'attente elle-même : un crawl qui le dépasse continue en
+    arrière-plan et remplira le cache à la fin, sans bloquer les requêtes.
+    """
+    if budget_seconds is None:
+        budget_seconds = WARMUP_BUDGET_SECONDS
+
+    # Repartir de zéro pour ne pas mélanger les mesures de deux tentatives
+    warmup = startup_metrics['warmup']
+    warmup.update(status='running', duration_seconds=None, recipes_count=0)
+    started_at = time.monotonic()
+
+    try:
+        if not get_cached_recipes():
+            start_catalog_build(deadline=started_at + budget_seconds).join(budget_seconds)
+
+        recipes = recipe_cache['data'] or []
+        warmup['recipes_count'] = len(recipes)
+        if recipes:
+            warmup['status'] = 'done'
+        elif is_catalog_building():
+            warmup['status'] = 'timeout'
+        else:
+            warmup['status'] = 'empty'
+    except Exception as e:
+        logger.error(f"Catalog warm-up failed: {e}")
+        warmup['status'] = 'failed'
+    finally:
+        warmup['duration_seconds'] = round(time.monotonic() - started_at, 3)
+        logger.info(f"Catalog warm-up {warmup['status']} in {warmup['duration_seconds']}s "
+                    f"({warmup['recipes_count']} recipes, budget {budget_seconds}s)")
+
+def start_warm_up():
+    """Lance le warm-up en arrière-plan, sauf s'il est déjà en cours"""
+    global warmup_thread
+    with warmup_lock:
+        if warmup_thread is not None and warmup_thread.is_alive():
+            return warmup_thread
+
+        startup_metrics['warmup'].update(status='pending', duration_seconds=None, recipes_count=0)
+        warmup_thread = threading.Thread(target=warm_up_catalog, name='catalog-warmup', daemon=True)
+        warmup_thread.start()
+        return warmup_thread
+
 @app.route('/api/recipes', methods=['GET'])
 def get_recipes():
     """Récupérer toutes les recettes disponibles avec cache optimisé"""
@@ -84,99 +351,20 @@ def get_recipes():
             logger.info(f"Specific search for: '{search}'")
             jow_api = get_jow()
             recipes_data = jow_api.search(to_search=search, limit=min(limit or 50, 100))
+            formatted_recipes = format_recipes(recipes_data)
+            result_recipes = formatted_recipes
+            cached = False
+
+            # Les résultats de recherche sont aussi scorés par la vue du garde-manger
+            pantry_view.index_search_results(formatted_recipes)
         else:
-            # Vérifier le cache d'abord
-            cached_recipes = get_cached_recipes()
-            if cached_recipes:
-                # Appliquer limite et offset sur les données cachées
-                start_idx = offset
-                end_idx = start_idx + (limit or len(cached_recipes))
-                recipes_data = cached_recipes[start_idx:end_idx]
-                
-                return jsonify({
-                    "success": True,
-                    "data": recipes_data,
-                    "total": len(cached_recipes),
-                    "limit": limit,
-                    "offset": offset,
-                    "cached": True
-                })
-            
-            # Cache expiré ou inexistant - récupérer de nouvelles recettes
-            logger.info("Cache miss - fetching new recipes from Jow API")
-            jow_api = get_jow()
-            
-            # Stratégie optimisée : moins de termes, plus ciblés
-            search_terms = [
-                'poulet', 'bœuf', 'poisson', 'pâtes', 'riz', 'salade', 
-                'légumes', 'dessert', 'soupe', 'gratin'
-            ]
-            all_recipes = {}
-            recipes_per_term = 15  # Limite réduite par terme pour éviter les timeouts
-            
-            for i, term in enumerate(search_terms):
-                try:
-                    logger.info(f"Searching for '{term}' ({i+1}/{len(search_terms)})")
-                    term_recipes = jow_api.search(to_search=term, limit=recipes_per_term)
-                    
-                    if term_recipes:
-                        for recipe in term_recipes:
-                            recipe_id = str(recipe.id) if hasattr(recipe, 'id') else f"{term}_{len(all_recipes)}"
-                            if recipe_id not in all_recipes:
-                                all_recipes[recipe_id] = recipe
-                                
-                    # Limiter à 100 recettes max pour éviter les timeouts
-                    if len(all_recipes) >= 100:
-                        logger.info("Reached 100 recipes limit, stopping search")
-                        break
-                        
-                except Exception as e:
-                    logger.warning(f"Error searching for term '{term}': {e}")
-                    continue
-            
-            recipes_data = list(all_recipes.values())
-            logger.info(f"Fetched {len(recipes_data)} unique recipes from {len(search_terms)} terms")
-        
-        # Transformation des données au format attendu par le frontend
-        formatted_recipes = []
-        
-        if recipes_data and isinstance(recipes_data, list):
-            for recipe in recipes_data:
-                try:
-                    formatted_ingredients = []
-                    if hasattr(recipe, 'ingredients') and recipe.ingredients:
-                        for ing in recipe.ingredients:
-                            if hasattr(ing, 'name'):
-                                formatted_ingredients.append(ing.name)
-                    
-                    formatted_recipe = {
-                        "id": str(recipe.id) if hasattr(recipe, 'id') else str(len(formatted_recipes)),
-                        "name": recipe.name if hasattr(recipe, 'name') else "Recette sans nom",
-                        "description": recipe.description if hasattr(recipe, 'description') else "Délicieuse recette",
-                        "ingredients": formatted_ingredients,
-                        "instructions": "Consultez le site Jow pour les instructions détaillées",
-                        "prepTime": recipe.preparationTime if hasattr(recipe, 'preparationTime') else 30,
-                        "difficulty": "medium",  # par défaut
-                        "image": recipe.imageUrl if hasattr(recipe, 'imageUrl') else None,
-                        "cookingTime": recipe.cookingTime if hasattr(recipe, 'cookingTime') else 0,
-                        "coversCount": 2  # Toujours pour 2 personnes
-                    }
-                    formatted_recipes.append(formatted_recipe)
-                except Exception as e:
-                    logger.warning(f"Error formatting recipe: {e}")
-                    continue
-
-        # Mettre en cache uniquement pour les recherches génériques (pas de search term)
-        if not search and formatted_recipes:
-            cache_recipes(formatted_recipes)
-
-        # Appliquer limite et offset
-        if not search:
+            # Catalogue générique : cache, sinon un seul crawl partagé
+            formatted_recipes, cached = get_catalog()
+
+            # Appliquer limite et offset
             start_idx = offset
             end_idx = start_idx + (limit or len(formatted_recipes))
             result_recipes = formatted_recipes[start_idx:end_idx]
-        else:
-            result_recipes = formatted_recipes
         
         logger.info(f"Successfully returned {len(result_recipes)} recipes")
         
@@ -186,9 +374,16 @@ def get_recipes():
             "total": len(formatted_recipes),
             "limit": limit,
             "offset": offset,
-            "cached": False
+            "cached": cached
         })
         
+    except TimeoutError as e:
+        logger.warning(f"Recipes requested while catalog is loading: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": "Recipe catalog is loading",
+            "message": str(e)
+        }), 503
     except Exception as e:
         logger.error(f"Error fetching recipes: {str(e)}")
         return jsonify({
@@ -199,15 +394,19 @@ def get_recipes():
 
 @app.route('/api/cache/clear', methods=['POST'])
 def clear_cache():
-    """Vider le cache des recettes"""
+    """Invalider le cache des recettes et le reconstruire en arrière-plan
+
+    Les recettes actuelles restent servies (et le pod reste prêt) jusqu'à ce
+    que le nouveau catalogue soit disponible.
+    """
     try:
-        recipe_cache['data'] = None
         recipe_cache['timestamp'] = None
-        logger.info("Recipe cache cleared manually")
+        start_catalog_build()
+        logger.info("Recipe cache invalidated manually, rebuilding in background")
         
         return jsonify({
             "success": True,
-            "message": "Cache cleared successfully"
+            "message": "Cache invalidated, rebuilding in background"
         })
     except Exception as e:
         logger.error(f"Error clearing cache: {str(e)}")
@@ -242,24 +441,7 @@ def get_recipe_details(recipe_id):
                 "error": "Recipe not found"
             }), 404
 
-        formatted_ingredients = []
-        if hasattr(recipe, 'ingredients') and recipe.ingredients:
-            for ing in recipe.ingredients:
-                if hasattr(ing, 'name'):
-                    formatted_ingredients.append(ing.name)
-
-        formatted_recipe = {
-            "id": str(recipe.id) if hasattr(recipe, 'id') else recipe_id,
-            "name": recipe.name if hasattr(recipe, 'name') else "Recette sans nom",
-            "description": recipe.description if hasattr(recipe, 'description') else "Délicieuse recette",
-            "ingredients": formatted_ingredients,
-            "instructions": "Consultez le site Jow pour les instructions détaillées",
-            "prepTime": recipe.preparationTime if hasattr(recipe, 'preparationTime') else 30,
-            "difficulty": "medium",
-            "image": recipe.imageUrl if hasattr(recipe, 'imageUrl') else None,
-            "cookingTime": recipe.cookingTime if hasattr(recipe, 'cookingTime') else 0,
-            "coversCount": 2  # Toujours pour 2 personnes
-        }
+        formatted_recipe = format_recipe(recipe, recipe_id)
         
         return jsonify({
             "success": True,
@@ -298,6 +480,186 @@ def get_ingredients():
             "message": str(e)
         }), 500
 
+@app.route('/api/pantry', methods=['GET'])
+def get_pantry():
+    """Récupérer le contenu du garde-manger"""
+    items = pantry_view.list_items()
+    return jsonify({
+        "success": True,
+        "data": items,
+        "total": len(items)
+    })
+
+@app.route('/api/pantry', methods=['POST'])
+def add_pantry_item():
+    """Ajouter un ingrédient au garde-manger"""
+    try:
+        item = pantry_view.add_item(request.get_json(silent=True) or {})
+        return jsonify({
+            "success": True,
+            "data": item
+        }), 201
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid ingredient",
+            "message": str(e)
+        }), 400
+    except Exception as e:
+        logger.error(f"Error adding pantry item: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": "Failed to add ingredient",
+            "message": str(e)
+        }), 500
+
+@app.route('/api/pantry/<item_id>', methods=['PUT', 'PATCH'])
+def update_pantry_item(item_id):
+    """Modifier un ingrédient (quantité à 0 = épuisé)"""
+    try:
+        item = pantry_view.update_item(item_id, request.get_json(silent=True) or {})
+        if item is None:
+            return jsonify({
+                "success": False,
+                "error": "Ingredient not found"
+            }), 404
+
+        return jsonify({
+            "success": True,
+            "data": item
+        })
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid ingredient",
+            "message": str(e)
+        }), 400
+    except Exception as e:
+        logger.error(f"Error updating pantry item {item_id}: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": "Failed to update ingredient",
+            "message": str(e)
+        }), 500
+
+@app.route('/api/pantry/<item_id>', methods=['DELETE'])
+def remove_pantry_item(item_id):
+    """Retirer un ingrédient du garde-manger"""
+    try:
+        if not pantry_view.remove_item(item_id):
+            return jsonify({
+                "success": False,
+                "error": "Ingredient not found"
+            }), 404
+
+        return jsonify({
+            "success": True,
+            "message": "Ingredient removed"
+        })
+    except Exception as e:
+        logger.error(f"Error removing pantry item {item_id}: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": "Failed to remove ingredient",
+            "message": str(e)
+        }), 500
+
+@app.route('/api/pantry/recipes', methods=['GET'])
+def get_pantry_recipes():
+    """Vue matérialisée : recettes cuisinables maintenant et à cuisiner vite"""
+    try:
+        limit = request.args.get('limit', '20')
+        days = request.args.get('days', str(USE_SOON_DAYS))
+        if not limit.isdigit() or int(limit) <= 0 or not days.isdigit() or int(days) <= 0:
+            return jsonify({
+                "success": False,
+                "error": "Invalid parameters",
+                "message": "'limit' and 'days' must be positive integers"
+            }), 400
+        limit, days = int(limit), int(days)
+
+        # Charge le catalogue si nécessaire (alimente la vue via cache_recipes)
+        get_catalog()
+
+        return jsonify({
+            "success": True,
+            "data": {
+                "cookableNow": pantry_view.cookable_now(limit=limit),
+                "useSoon": pantry_view.use_soon(limit=limit, days=days),
+                "matches": pantry_view.matches()
+            }
+        })
+    except TimeoutError as e:
+        logger.warning(f"Pantry recipes requested while catalog is loading: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": "Recipe catalog is loading",
+            "message": str(e)
+        }), 503
+    except Exception as e:
+        logger.error(f"Error fetching pantry recipes: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": "Failed to fetch pantry recipes",
+            "message": str(e)
+        }), 500
+
+@app.route('/api/shopping-list', methods=['POST'])
+def get_shopping_list():
+    """Liste de courses agrégée d'un planning, déduction faite du garde-manger"""
+    try:
+        recipe_ids, covers, include_optional, pantry_items = parse_request(request.get_json(silent=True))
+
+        # Catalogue, puis recettes déjà vues via la recherche
+        catalog, _ = get_catalog()
+        recipes_by_id = {recipe['id']: recipe for recipe in catalog}
+        planned_recipes = []
+        missing_recipes = []
+        for recipe_id in recipe_ids:
+            recipe = recipes_by_id.get(recipe_id) or pantry_view.find_recipe(recipe_id)
+            if recipe is None:
+                missing_recipes.append(recipe_id)
+            else:
+                planned_recipes.append((recipe, covers))
+
+        # Garde-manger du serveur, sauf si le client envoie le sien
+        if pantry_items is None:
+            pantry_items = pantry_view.list_items()
+
+        needs = aggregate_needs(planned_recipes, include_optional=include_optional)
+        deficit = compute_deficit(needs, pantry_items)
+
+        logger.info(f"Shopping list: {len(planned_recipes)} recipes, {len(needs)} ingredients, {len(deficit)} to buy")
+
+        return jsonify({
+            "success": True,
+            "data": deficit,
+            "total": len(deficit),
+            "recipesCount": len(planned_recipes),
+            "missingRecipes": missing_recipes
+        })
+
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid plan",
+            "message": str(e)
+        }), 400
+    except TimeoutError as e:
+        logger.warning(f"Shopping list requested while catalog is loading: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": "Recipe catalog is loading",
+            "message": str(e)
+        }), 503
+    except Exception as e:
+        logger.error(f"Error building shopping list: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": "Failed to build shopping list",
+            "message": str(e)
+        }), 500
+
 def map_difficulty(difficulty):
     """Mapper la difficulté de Jow vers notre format"""
     if not difficulty:
@@ -328,6 +690,13 @@ def internal_error(error):
         "error": "Internal server error"
     }), 500
 
+startup_metrics['import_seconds'] = round(time.perf_counter() - _import_started_at, 3)
+logger.info(f"Food Planner API module loaded in {startup_metrics['import_seconds']}s")
+
+# Sous le reloader de Flask, seul le processus enfant (WERKZEUG_RUN_MAIN) sert les requêtes
+if WARMUP_ON_BOOT and (__name__ != '__main__' or os.environ.get('WERKZEUG_RUN_MAIN') == 'true'):
+    start_warm_up()
+
 if __name__ == '__main__':
     logger.info("Starting Food Planner API Server...")
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -2,8 +2,8 @@ from flask import Flask, jsonify, request
 from flask_cors import CORS
 import json
 from datetime import datetime
-from jow_api import Jow
 import logging
+import time
 
 # Configuration du logging
 logging.basicConfig(level=logging.DEBUG)
@@ -12,19 +12,37 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)
 
-# Test de l'initialisation de Jow
-try:
-    logger.info("Initializing Jow API...")
-    jow = Jow()
-    logger.info("Jow API initialized successfully!")
-    
-    # Test de recherche
-    test_result = jow.search('poulet', limit=3)
-    logger.info(f"Test search successful: {len(test_result)} recipes found")
-    
-except Exception as e:
-    logger.error(f"Error initializing Jow API: {e}")
-    jow = None
+# Instance de l'API Jow - initialisée au premier besoin, pas à l'import
+jow = None
+jow_status = "not_initialized"
+
+def get_jow():
+    """Initialise Jow API si nécessaire (None en cas d'échec)"""
+    global jow, jow_status
+    if jow is None:
+        try:
+            logger.info("Initializing Jow API...")
+            started_at = time.perf_counter()
+            from jow_api import Jow
+            jow = Jow()
+            jow_status = "available"
+            logger.info(f"Jow API initialized successfully in {time.perf_counter() - started_at:.3f}s!")
+        except Exception as e:
+            logger.error(f"Error initializing Jow API: {e}")
+            jow = None
+            jow_status = "failed"
+    return jow
+
+def run_test_search():
+    """Recherche de test pour valider la connexion à Jow"""
+    jow_api = get_jow()
+    if jow_api is None:
+        return
+    try:
+        test_result = jow_api.search('poulet', limit=3)
+        logger.info(f"Test search successful: {len(test_result)} recipes found")
+    except Exception as e:
+        logger.error(f"Test search failed: {e}")
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -34,14 +52,15 @@ def health_check():
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "service": "Food Planner API",
-        "jow_available": jow is not None
+        "jow_status": jow_status  # not_initialized tant qu'aucune recette n'a été demandée
     })
 
 @app.route('/api/recipes', methods=['GET'])
 def get_recipes():
     """Récupérer toutes les recettes disponibles"""
     try:
-        if jow is None:
+        jow_api = get_jow()
+        if jow_api is None:
             return jsonify({
                 "success": False,
                 "error": "Jow API not available",
@@ -56,7 +75,7 @@ def get_recipes():
         
         # Rechercher des recettes
         query = search if search else 'poulet'  # terme de recherche par défaut
-        recipes_data = jow.search(to_search=query, limit=limit)
+        recipes_data = jow_api.search(to_search=query, limit=limit)
         
         # Transformation des données au format attendu par le frontend
         formatted_recipes = []
@@ -107,4 +126,5 @@ def get_recipes():
 
 if __name__ == '__main__':
     logger.info("Starting Food Planner API Server...")
+    run_test_search()
     app.run(debug=True, host='127.0.0.1', port=5001)
@@ -0,0 +1,3 @@
+# Scripts manuels, pas des tests : test_jow.py interroge l'API Jow en direct,
+# simple_test.py démarre un serveur Flask de démonstration
+collect_ignore = ["test_jow.py", "simple_test.py"]
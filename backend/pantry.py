@@ -0,0 +1,472 @@
+"""
+Garde-manger persistant et vue matérialisée "cuisinable maintenant / à utiliser vite"
+
+Les scores de correspondance des recettes sont maintenus de façon incrémentale :
+un index ingrédient -> recettes permet de ne recalculer, à chaque modification
+du garde-manger ou à chaque péremption, que les recettes qui contiennent
+l'ingrédient concerné.
+"""
+
+import heapq
+import json
+import logging
+import math
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+VALID_UNITS = ('kg', 'g', 'l', 'ml', 'pieces')
+
+# Même fenêtre que le compteur "Expire bientôt" du frontend (0 <= jours restants <= 7)
+USE_SOON_DAYS = 7
+
+# Nombre maximal de recettes issues des recherches gardées dans la vue (LRU)
+MAX_SEARCH_RESULTS = 300
+
+
+def normalize_name(name):
+    """Clé de comparaison d'un nom d'ingrédient"""
+    return str(name or '').strip().lower()
+
+
+def parse_date(value):
+    """Accepte une date ISO (avec ou sans heure, y compris le format JSON de JS)"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if not value:
+        raise ValueError("Missing date")
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        raise ValueError(f"Invalid date: {value}")
+
+
+def names_match(pantry_key, ingredient_key):
+    """Même règle que le frontend : l'un des noms contient l'autre"""
+    return pantry_key in ingredient_key or ingredient_key in pantry_key
+
+
+def is_expired(item, today):
+    """Un article est périmé le lendemain de sa date d'expiration"""
+    return bool(item.get('expirationDate')) and item['expirationDate'] < today.isoformat()
+
+
+def validate_item(data, existing=None, require_expiration=True):
+    """Construit un ingrédient valide à partir d'un payload (lève ValueError)
+
+    Sans `require_expiration`, une date d'expiration absente est conservée à
+    None et l'article est considéré comme non périssable.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Ingredient must be a JSON object")
+
+    merged = dict(existing or {})
+    merged.update({k: v for k, v in data.items() if v is not None})
+
+    name = str(merged.get('name', '')).strip()
+    if not name:
+        raise ValueError("Ingredient name is required")
+
+    try:
+        quantity = float(merged.get('quantity', 0))
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid quantity: {merged.get('quantity')}")
+    if not math.isfinite(quantity) or quantity < 0:
+        raise ValueError(f"Invalid quantity: {merged.get('quantity')}")
+
+    unit = merged.get('unit', 'pieces')
+    if unit not in VALID_UNITS:
+        raise ValueError(f"Invalid unit: {unit}")
+
+    expiration = merged.get('expirationDate')
+    if expiration or require_expiration:
+        expiration = parse_date(expiration).isoformat()
+
+    return {
+        "id": str(merged.get('id') or uuid.uuid4()),
+        "name": name,
+        "quantity": quantity,
+        "unit": unit,
+        "expirationDate": expiration or None,
+        "addedDate": parse_date(merged.get('addedDate') or date.today()).isoformat()
+    }
+
+
+class PantryView:
+    """Garde-manger persisté sur disque et vue matérialisée des recettes"""
+
+    def __init__(self, path=None, clock=date.today, max_search_results=MAX_SEARCH_RESULTS):
+        self.path = path
+        self.clock = clock
+        self.lock = threading.RLock()
+
+        # Garde-manger : id -> ingrédient, et tas (date d'expiration, id) pour les péremptions
+        self.items = {}
+        self.expiry_heap = []
+        self.today = clock()
+
+        # Catalogue : id -> recette, et index ingrédient -> ids de recettes
+        self.recipes = {}
+        self.recipe_keys = {}
+        self.ingredient_index = {}
+        self.catalog_ids = set()
+
+        # Recettes issues des recherches, de la moins à la plus récemment vue
+        self.search_ids = OrderedDict()
+        self.max_search_results = max_search_results
+
+        # Couverture : ingrédient de recette -> ids des articles utilisables qui le fournissent
+        self.coverage = {}
+
+        # Vue matérialisée
+        self.scores = {}
+        self.cookable = set()
+        self.urgency_heap = []
+        self.versions = {}
+
+        self.load()
+
+    # ------------------------------------------------------------------
+    # Persistance
+    # ------------------------------------------------------------------
+
+    def load(self):
+        """Recharge le garde-manger depuis le fichier JSON s'il existe"""
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            for raw in stored:
+                item = validate_item(raw)
+                self.items[item['id']] = item
+                self._track_expiry(item)
+            logger.info(f"Loaded {len(self.items)} pantry items from {self.path}")
+        except Exception as e:
+            logger.error(f"Error loading pantry from {self.path}: {e}")
+
+    def save(self, items):
+        """Écrit `items` de façon atomique"""
+        if not self.path:
+            return
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(list(items.values()), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def _commit(self, items):
+        """Persiste d'abord, puis remplace l'état en mémoire (inchangé si l'écriture échoue)"""
+        self.save(items)
+        self.items = items
+
+    # ------------------------------------------------------------------
+    # Garde-manger
+    # ------------------------------------------------------------------
+
+    def list_items(self):
+        with self.lock:
+            self.sweep_expired()
+            return sorted(self.items.values(), key=lambda item: item['expirationDate'] or '9999-12-31')
+
+    def add_item(self, data):
+        with self.lock:
+            self.sweep_expired()
+            if not isinstance(data, dict):
+                raise ValueError("Ingredient must be a JSON object")
+
+            item = validate_item({k: v for k, v in data.items() if k != 'id'})
+            self._commit(dict(self.items, **{item['id']: item}))
+            self._track_expiry(item)
+            self._refresh_item(item['name'])
+            return item
+
+    def update_item(self, item_id, data):
+        """Met à jour un ingrédient (quantité à 0 = épuisé) ; None si inconnu"""
+        with self.lock:
+            self.sweep_expired()
+            existing = self.items.get(item_id)
+            if existing is None:
+                return None
+            if not isinstance(data, dict):
+                raise ValueError("Ingredient must be a JSON object")
+
+            item = validate_item(dict(data, id=item_id), existing)
+            self._commit(dict(self.items, **{item_id: item}))
+            self._track_expiry(item)
+            self._refresh_item(existing['name'])
+            if normalize_name(item['name']) != normalize_name(existing['name']):
+                self._refresh_item(item['name'])
+            return item
+
+    def remove_item(self, item_id):
+        with self.lock:
+            self.sweep_expired()
+            item = self.items.get(item_id)
+            if item is None:
+                return False
+
+            self._commit({k: v for k, v in self.items.items() if k != item_id})
+            self._refresh_item(item['name'])
+            return True
+
+    # ------------------------------------------------------------------
+    # Péremption
+    # ------------------------------------------------------------------
+
+    def _track_expiry(self, item):
+        if item['expirationDate']:
+            heapq.heappush(self.expiry_heap, (item['expirationDate'], item['id']))
+
+    def sweep_expired(self):
+        """Au changement de jour, re-score les recettes des seuls articles qui viennent d'expirer"""
+        with self.lock:
+            today = self.clock()
+            if today <= self.today:
+                return 0
+
+            self.today = today
+            limit = today.isoformat()
+            expired_names = set()
+
+            while self.expiry_heap and self.expiry_heap[0][0] < limit:
+                expiration, item_id = heapq.heappop(self.expiry_heap)
+                item = self.items.get(item_id)
+                # Entrée obsolète si l'article a été retiré ou sa date modifiée
+                if item is not None and item['expirationDate'] == expiration:
+                    expired_names.add(item['name'])
+
+            for name in expired_names:
+                self._refresh_item(name)
+            return len(expired_names)
+
+    # ------------------------------------------------------------------
+    # Catalogue et index
+    # ------------------------------------------------------------------
+
+    def set_recipes(self, recipes):
+        """Synchronise le catalogue : seules les recettes ajoutées ou modifiées sont indexées"""
+        with self.lock:
+            incoming_ids = {recipe['id'] for recipe in recipes}
+
+            for recipe_id in self.catalog_ids - incoming_ids:
+                if recipe_id not in self.search_ids:
+                    self._unindex_recipe(recipe_id)
+            self.catalog_ids = incoming_ids
+
+            self.index_recipes(recipes)
+
+    def index_search_results(self, recipes):
+        """Indexe des résultats de recherche, en ne gardant que les plus récents"""
+        with self.lock:
+            self.index_recipes(recipes)
+            for recipe in recipes:
+                self.search_ids[recipe['id']] = None
+                self.search_ids.move_to_end(recipe['id'])
+
+            evicted = 0
+            while len(self.search_ids) > self.max_search_results:
+                recipe_id, _ = self.search_ids.popitem(last=False)
+                if recipe_id not in self.catalog_ids:
+                    self._unindex_recipe(recipe_id)
+                    evicted += 1
+
+            if evicted:
+                logger.info(f"Pantry view: evicted {evicted} old search results")
+
+    def index_recipes(self, recipes):
+        """Ajoute ou met à jour des recettes sans en retirer"""
+        with self.lock:
+            self.sweep_expired()
+            changed = 0
+            for recipe in recipes:
+                recipe_id = recipe['id']
+                current = self.recipes.get(recipe_id)
+                if current is not None and current.get('ingredients') == recipe.get('ingredients'):
+                    self.recipes[recipe_id] = recipe
+                    continue
+                if current is not None:
+                    self._unindex_recipe(recipe_id)
+                self._index_recipe(recipe)
+                changed += 1
+
+            logger.info(f"Pantry view: {changed} recipes (re)indexed, {len(self.recipes)} total")
+            return changed
+
+    def find_recipe(self, recipe_id):
+        """Recette connue de la vue (catalogue ou résultat de recherche), sinon None"""
+        with self.lock:
+            return self.recipes.get(recipe_id)
+
+    def _covering_items(self, key):
+        today = self.today
+        return {
+            item_id for item_id, item in self.items.items()
+            if item['quantity'] > 0 and not is_expired(item, today)
+            and names_match(normalize_name(item['name']), key)
+        }
+
+    def _index_recipe(self, recipe):
+        recipe_id = recipe['id']
+        keys = [normalize_name(name) for name in recipe.get('ingredients', []) if normalize_name(name)]
+
+        self.recipes[recipe_id] = recipe
+        self.recipe_keys[recipe_id] = keys
+        for key in keys:
+            if key not in self.ingredient_index:
+                self.ingredient_index[key] = set()
+                self.coverage[key] = self._covering_items(key)
+            self.ingredient_index[key].add(recipe_id)
+
+        self._score_recipe(recipe_id)
+
+    def _unindex_recipe(self, recipe_id):
+        for key in self.recipe_keys.pop(recipe_id, []):
+            recipe_ids = self.ingredient_index.get(key)
+            if recipe_ids is None:
+                continue
+            recipe_ids.discard(recipe_id)
+            if not recipe_ids:
+                del self.ingredient_index[key]
+                del self.coverage[key]
+
+        self.recipes.pop(recipe_id, None)
+        self.scores.pop(recipe_id, None)
+        self.cookable.discard(recipe_id)
+        # Les entrées du tas deviennent obsolètes via le numéro de version
+        self.versions[recipe_id] = self.versions.get(recipe_id, 0) + 1
+
+    # ------------------------------------------------------------------
+    # Mise à jour incrémentale
+    # ------------------------------------------------------------------
+
+    def _refresh_item(self, name):
+        """Recalcule la couverture des ingrédients liés à `name` puis les recettes concernées"""
+        pantry_key = normalize_name(name)
+        affected = set()
+
+        for key in self.ingredient_index:
+            if not names_match(pantry_key, key):
+                continue
+            self.coverage[key] = self._covering_items(key)
+            affected |= self.ingredient_index[key]
+
+        for recipe_id in affected:
+            self._score_recipe(recipe_id)
+
+        logger.info(f"Pantry change on '{name}': re-scored {len(affected)}/{len(self.recipes)} recipes")
+        return affected
+
+    def _score_recipe(self, recipe_id):
+        keys = self.recipe_keys.get(recipe_id, [])
+        matched = [key for key in keys if self.coverage.get(key)]
+
+        # Urgence = date d'expiration la plus proche parmi les ingrédients utilisés
+        expirations = [
+            self.items[item_id]['expirationDate']
+            for key in matched
+            for item_id in self.coverage[key]
+            if self.items[item_id]['expirationDate']
+        ]
+        soonest = min(expirations) if expirations else None
+
+        percentage = round(len(matched) / len(keys) * 100) if keys else 0
+        self.scores[recipe_id] = {
+            "matchPercentage": percentage,
+            "matchedIngredients": len(matched),
+            "matchedKeys": sorted(set(matched)),
+            "totalIngredients": len(keys),
+            "soonestExpiration": soonest
+        }
+
+        if keys and len(matched) == len(keys):
+            self.cookable.add(recipe_id)
+        else:
+            self.cookable.discard(recipe_id)
+
+        version = self.versions.get(recipe_id, 0) + 1
+        self.versions[recipe_id] = version
+        if soonest is not None:
+            heapq.heappush(self.urgency_heap, (soonest, -percentage, recipe_id, version))
+
+        # Compacter le tas quand les entrées obsolètes dominent
+        if len(self.urgency_heap) > 4 * max(len(self.scores), 16):
+            self.urgency_heap = [
+                entry for entry in self.urgency_heap
+                if self.versions.get(entry[2]) == entry[3]
+            ]
+            heapq.heapify(self.urgency_heap)
+
+    # ------------------------------------------------------------------
+    # Lecture de la vue
+    # ------------------------------------------------------------------
+
+    def _summary(self, recipe_id):
+        recipe = self.recipes[recipe_id]
+        score = self.scores[recipe_id]
+        summary = {
+            "id": recipe_id,
+            "name": recipe.get('name'),
+            "image": recipe.get('image'),
+            "prepTime": recipe.get('prepTime'),
+            **score
+        }
+        if score['soonestExpiration']:
+            summary['daysUntilExpiration'] = (date.fromisoformat(score['soonestExpiration']) - self.today).days
+        return summary
+
+    def use_soon(self, limit=20, days=USE_SOON_DAYS):
+        """Recettes par urgence croissante des ingrédients qui expirent dans `days` jours"""
+        with self.lock:
+            self.sweep_expired()
+            today = self.today.isoformat()
+            horizon = (self.today + timedelta(days=days)).isoformat()
+            results = []
+            kept = []
+
+            while self.urgency_heap and len(results) < limit:
+                entry = heapq.heappop(self.urgency_heap)
+                soonest, _, recipe_id, version = entry
+                if self.versions.get(recipe_id) != version or soonest < today:
+                    continue  # entrée obsolète, supprimée définitivement
+                kept.append(entry)
+                if soonest > horizon:
+                    break
+                results.append(self._summary(recipe_id))
+
+            for entry in kept:
+                heapq.heappush(self.urgency_heap, entry)
+
+            return results
+
+    def cookable_now(self, limit=20):
+        """Recettes dont tous les ingrédients sont disponibles et non périmés"""
+        with self.lock:
+            self.sweep_expired()
+            summaries = [self._summary(recipe_id) for recipe_id in self.cookable]
+        summaries.sort(key=lambda s: (s['soonestExpiration'] or '9999-12-31', s['name'] or ''))
+        return summaries[:limit]
+
+    def matches(self):
+        """Correspondance des recettes ayant au moins un ingrédient disponible
+
+        `matchedKeys` liste les ingrédients (normalisés) couverts par le garde-manger,
+        pour que le frontend affiche exactement ce que compte le score.
+        """
+        with self.lock:
+            self.sweep_expired()
+            return {
+                recipe_id: {
+                    "matchPercentage": score['matchPercentage'],
+                    "matchedKeys": score['matchedKeys']
+                }
+                for recipe_id, score in self.scores.items()
+                if score['matchPercentage'] > 0
+            }
@@ -0,0 +1,218 @@
+"""
+Liste de courses agrégée pour un planning de repas
+
+Les besoins de toutes les recettes du planning sont agrégés en une seule passe,
+convertis dans une unité de base (g, ml ou pièces), puis le stock du
+garde-manger est soustrait pour ne renvoyer que ce qui manque.
+"""
+
+import math
+import re
+import unicodedata
+from datetime import date
+
+from pantry import is_expired, normalize_name, validate_item
+
+# Unité normalisée -> (dimension, facteur vers l'unité de base de la dimension)
+UNIT_CONVERSIONS = {
+    'mg': ('mass', 0.001),
+    'g': ('mass', 1),
+    'gramme': ('mass', 1),
+    'grammes': ('mass', 1),
+    'kg': ('mass', 1000),
+    'ml': ('volume', 1),
+    'cl': ('volume', 10),
+    'dl': ('volume', 100),
+    'l': ('volume', 1000),
+    'litre': ('volume', 1000),
+    'litres': ('volume', 1000),
+    'c. a soupe': ('volume', 15),
+    'cuillere a soupe': ('volume', 15),
+    'c. a cafe': ('volume', 5),
+    'cuillere a cafe': ('volume', 5),
+    'pieces': ('count', 1),
+    'piece': ('count', 1),
+    'piece(s)': ('count', 1),
+    'unite': ('count', 1),
+    'unite(s)': ('count', 1),
+    '': ('count', 1),
+}
+
+BASE_UNITS = {
+    'mass': 'g',
+    'volume': 'ml',
+    'count': 'pieces'
+}
+
+
+def normalize_unit(unit):
+    """Minuscules, sans accents ni espaces superflus"""
+    text = unicodedata.normalize('NFKD', str(unit or '')).encode('ascii', 'ignore').decode('ascii')
+    return ' '.join(text.lower().split())
+
+
+def to_base(quantity, unit):
+    """Convertit une quantité vers l'unité de base : (dimension, quantité, unité de base)
+
+    Les unités inconnues (tranche, gousse, pincée...) forment leur propre
+    dimension et ne sont jamais converties.
+    """
+    key = normalize_unit(unit)
+    if key in UNIT_CONVERSIONS:
+        dimension, factor = UNIT_CONVERSIONS[key]
+        return dimension, float(quantity or 0) * factor, BASE_UNITS[dimension]
+    return f"unit:{key}", float(quantity or 0), str(unit)
+
+
+def name_tokens(key_name):
+    """Mots d'un nom normalisé, sans le pluriel (oeufs -> oeuf)"""
+    return {
+        word[:-1] if len(word) > 3 and word.endswith(('s', 'x')) else word
+        for word in re.findall(r'\w+', key_name)
+    }
+
+
+def tokens_match(pantry_key, ingredient_key):
+    """Les mots de l'un des noms sont tous présents dans l'autre
+
+    Contrairement à une recherche de sous-chaîne, "riz" ne correspond pas à
+    "chorizo" mais correspond bien à "riz basmati".
+    """
+    pantry_tokens, ingredient_tokens = name_tokens(pantry_key), name_tokens(ingredient_key)
+    if not pantry_tokens or not ingredient_tokens:
+        return False
+    return pantry_tokens <= ingredient_tokens or ingredient_tokens <= pantry_tokens
+
+
+def parse_request(payload):
+    """Valide le corps de la requête (lève ValueError)
+
+    Retourne (ids des recettes, couverts, ingrédients optionnels, garde-manger
+    du client ou None pour utiliser celui du serveur).
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("Body must be a JSON object")
+
+    # Accepte une liste d'ids et/ou directement le planning hebdomadaire du frontend
+    raw_ids = payload.get('recipeIds', [])
+    if not isinstance(raw_ids, list) or not all(isinstance(i, (str, int)) and not isinstance(i, bool) for i in raw_ids):
+        raise ValueError("'recipeIds' must be a list of ids")
+    recipe_ids = [str(recipe_id) for recipe_id in raw_ids]
+
+    plan = payload.get('plan', [])
+    if not isinstance(plan, list):
+        raise ValueError("'plan' must be a list of days")
+    for day in plan:
+        if not isinstance(day, dict):
+            raise ValueError("Each plan entry must be an object")
+        for meal in ('lunch', 'dinner'):
+            recipe = day.get(meal)
+            if recipe is None:
+                continue
+            if not isinstance(recipe, dict) or not recipe.get('id'):
+                raise ValueError(f"'{meal}' must be a recipe object with an 'id'")
+            recipe_ids.append(str(recipe['id']))
+
+    if not recipe_ids:
+        raise ValueError("Provide 'recipeIds' or 'plan'")
+
+    covers = payload.get('covers', 2)
+    if isinstance(covers, bool) or not isinstance(covers, (int, float)) or not math.isfinite(covers) or covers <= 0:
+        raise ValueError("'covers' must be a positive number")
+
+    pantry_items = payload.get('pantry')
+    if pantry_items is not None:
+        if not isinstance(pantry_items, list):
+            raise ValueError("'pantry' must be a list of ingredients")
+        # Une date d'expiration absente signifie "non périssable"
+        pantry_items = [validate_item(item, require_expiration=False) for item in pantry_items]
+
+    include_optional = payload.get('includeOptional', False)
+    if not isinstance(include_optional, bool):
+        raise ValueError("'includeOptional' must be a boolean")
+
+    return recipe_ids, covers, include_optional, pantry_items
+
+
+def aggregate_needs(planned_recipes, include_optional=False):
+    """Agrège les besoins de `planned_recipes`, liste de (recette, nombre de couverts)
+
+    Retourne un dict (nom normalisé, dimension) -> besoin.
+    """
+    needs = {}
+
+    for recipe, covers in planned_recipes:
+        for ing in recipe.get('ingredientDetails', []):
+            if ing.get('isOptional') and not include_optional:
+                continue
+
+            key_name = normalize_name(ing.get('name'))
+            if not key_name:
+                continue
+
+            dimension, quantity, base_unit = to_base((ing.get('quantity') or 0) * covers, ing.get('unit'))
+            need = needs.get((key_name, dimension))
+            if need is None:
+                need = needs[(key_name, dimension)] = {
+                    "name": ing.get('name'),
+                    "unit": base_unit,
+                    "needed": 0.0,
+                    "recipes": []
+                }
+            need['needed'] += quantity
+            if recipe['id'] not in need['recipes']:
+                need['recipes'].append(recipe['id'])
+
+    return needs
+
+
+def compute_deficit(needs, pantry_items, today=None):
+    """Soustrait le stock du garde-manger et retourne ce qui reste à acheter
+
+    Le stock va d'abord aux besoins portant exactement le même nom, puis le
+    reste aux noms proches (mêmes mots, ex. "riz" pour "riz basmati"). Le stock
+    d'un article n'est consommé qu'une fois, même s'il correspond à plusieurs
+    besoins. Les articles épuisés ou périmés ne comptent pas.
+    """
+    today = today or date.today()
+    stock = []
+    for item in pantry_items:
+        if item['quantity'] <= 0 or is_expired(item, today):
+            continue
+        dimension, quantity, _ = to_base(item['quantity'], item.get('unit'))
+        stock.append({"key": normalize_name(item['name']), "dimension": dimension, "remaining": quantity})
+
+    available = {need_key: 0.0 for need_key in needs}
+
+    def allocate(matches):
+        for (key_name, dimension), need in needs.items():
+            for entry in stock:
+                wanted = need['needed'] - available[(key_name, dimension)]
+                if wanted <= 0:
+                    break
+                if entry['dimension'] != dimension or entry['remaining'] <= 0:
+                    continue
+                if not matches(entry['key'], key_name):
+                    continue
+                used = min(entry['remaining'], wanted)
+                entry['remaining'] -= used
+                available[(key_name, dimension)] += used
+
+    allocate(lambda pantry_key, key_name: pantry_key == key_name)
+    allocate(tokens_match)
+
+    deficit = []
+    for need_key, need in needs.items():
+        missing = need['needed'] - available[need_key]
+        if missing > 1e-9:
+            deficit.append({
+                "name": need['name'],
+                "unit": need['unit'],
+                "needed": round(need['needed'], 2),
+                "available": round(available[need_key], 2),
+                "missing": round(missing, 2),
+                "recipes": need['recipes']
+            })
+
+    deficit.sort(key=lambda d: normalize_name(d['name']))
+    return deficit
@@ -0,0 +1,161 @@
+import importlib
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+
+# Le garde-manger de l'application ne doit pas écrire dans le dépôt pendant les tests
+os.environ.setdefault('PANTRY_FILE', os.path.join(tempfile.mkdtemp(), 'pantry.json'))
+
+import app  # noqa: E402
+
+
+class FakeRecipe:
+    def __init__(self, recipe_id):
+        self.id = recipe_id
+        self.name = f"Recette {recipe_id}"
+        self.ingredients = []
+
+
+class FakeJow:
+    """Remplace l'API Jow : réponses immédiates, ou bloquées jusqu'à `release`"""
+
+    def __init__(self, blocking=False):
+        self.blocking = blocking
+        self.release = threading.Event()
+
+    def search(self, to_search, limit):
+        if self.blocking:
+            self.release.wait()
+        return [FakeRecipe(f"{to_search}-{i}") for i in range(2)]
+
+
+@pytest.fixture
+def fake_jow(monkeypatch):
+    jows = []
+
+    def install(blocking=False):
+        jow = FakeJow(blocking)
+        jows.append(jow)
+        monkeypatch.setattr(app, 'get_jow', lambda: jow)
+        return jow
+
+    app.recipe_cache.update(data=None, timestamp=None)
+    app.catalog_build.update(thread=None, started_at=None)
+    app.warmup_thread = None
+    yield install
+
+    for jow in jows:
+        jow.release.set()
+    for thread in (app.catalog_build['thread'], app.warmup_thread):
+        if thread is not None:
+            thread.join(5)
+
+
+@pytest.fixture
+def client():
+    return app.app.test_client()
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.01)
+
+
+def test_readiness_warms_catalog(fake_jow, client):
+    fake_jow()
+
+    response = client.get('/health/ready')
+    assert response.status_code == 503
+    assert response.json['status'] == 'warming_up'
+
+    app.warmup_thread.join(5)
+    response = client.get('/health/ready')
+    assert response.status_code == 200
+    assert response.json['cache']['recipes_count'] == 20
+    assert app.startup_metrics['warmup']['status'] == 'done'
+
+
+def test_warm_up_budget_times_out(fake_jow):
+    jow = fake_jow(blocking=True)
+
+    started_at = time.monotonic()
+    app.warm_up_catalog(budget_seconds=0.1)
+
+    assert time.monotonic() - started_at < 1
+    assert app.startup_metrics['warmup']['status'] == 'timeout'
+    assert app.startup_metrics['warmup']['recipes_count'] == 0
+
+    # Le crawl continue en arrière-plan et remplit le cache une fois débloqué
+    jow.release.set()
+    app.catalog_build['thread'].join(5)
+    assert app.is_catalog_warm()
+
+
+def test_warm_up_retry_resets_metrics(fake_jow):
+    fake_jow(blocking=True)
+    app.startup_metrics['warmup'].update(status='empty', duration_seconds=0.002, recipes_count=3)
+
+    app.start_warm_up()
+    wait_until(lambda: app.startup_metrics['warmup']['status'] == 'running')
+    assert app.startup_metrics['warmup']['duration_seconds'] is None
+    assert app.startup_metrics['warmup']['recipes_count'] == 0
+
+
+def test_cold_request_gets_503_instead_of_hanging(fake_jow, client, monkeypatch):
+    fake_jow(blocking=True)
+    monkeypatch.setattr(app, 'CATALOG_WAIT_SECONDS', 0.1)
+
+    response = client.get('/api/recipes')
+    assert response.status_code == 503
+
+
+def test_expired_catalog_served_while_rebuilding(fake_jow, client):
+    jow = fake_jow(blocking=True)
+    app.cache_recipes([{"id": "old", "name": "Ancienne", "ingredients": []}])
+    app.recipe_cache['timestamp'] = time.time() - app.recipe_cache['ttl'] - 1
+
+    response = client.get('/api/recipes')
+    assert response.status_code == 200
+    assert [r['id'] for r in response.json['data']] == ['old']
+    assert app.is_catalog_building()
+
+    jow.release.set()
+    app.catalog_build['thread'].join(5)
+    assert 'old' not in [r['id'] for r in client.get('/api/recipes').json['data']]
+
+
+def test_cache_clear_keeps_pod_ready(fake_jow, client):
+    jow = fake_jow(blocking=True)
+    app.cache_recipes([{"id": "old", "name": "Ancienne", "ingredients": []}])
+
+    assert client.post('/api/cache/clear').status_code == 200
+    assert client.get('/health/ready').status_code == 200
+    assert client.get('/api/recipes').json['data'][0]['id'] == 'old'
+
+    jow.release.set()
+    app.catalog_build['thread'].join(5)
+    assert client.get('/health/ready').json['cache']['status'] == 'valid'
+
+
+@pytest.mark.parametrize("query", ["limit=0", "days=-1", "limit=abc", "days=1.5"])
+def test_pantry_recipes_rejects_invalid_parameters(client, query):
+    response = client.get(f'/api/pantry/recipes?{query}')
+    assert response.status_code == 400
+    assert response.json['success'] is False
+
+
+def test_app_debug_imports_without_jow_api(monkeypatch):
+    # Un module à None dans sys.modules fait échouer tout `import jow_api`
+    monkeypatch.setitem(sys.modules, 'jow_api', None)
+    monkeypatch.delitem(sys.modules, 'app_debug', raising=False)
+
+    app_debug = importlib.import_module('app_debug')
+    assert app_debug.jow is None
+    assert app_debug.jow_status == 'not_initialized'
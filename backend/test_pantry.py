@@ -0,0 +1,185 @@
+from datetime import date, timedelta
+
+import pytest
+
+from pantry import PantryView, validate_item
+
+TODAY = date(2025, 8, 20)
+
+RECIPES = [
+    {"id": "1", "name": "Poulet riz", "ingredients": ["Poulet", "Riz"]},
+    {"id": "2", "name": "Salade", "ingredients": ["Salade", "Tomate"]},
+    {"id": "3", "name": "Riz cantonais", "ingredients": ["riz", "oeuf"]},
+]
+
+
+class Clock:
+    def __init__(self, today):
+        self.today = today
+
+    def __call__(self):
+        return self.today
+
+
+def in_days(days):
+    return (TODAY + timedelta(days=days)).isoformat()
+
+
+def percentages(view):
+    return {recipe_id: match["matchPercentage"] for recipe_id, match in view.matches().items()}
+
+
+@pytest.fixture
+def clock():
+    return Clock(TODAY)
+
+
+@pytest.fixture
+def view(tmp_path, clock):
+    view = PantryView(str(tmp_path / "pantry.json"), clock=clock)
+    view.set_recipes(RECIPES)
+    return view
+
+
+def test_add_rescores_only_recipes_with_ingredient(view):
+    view.add_item({"name": "riz", "quantity": 500, "unit": "g", "expirationDate": in_days(2)})
+    affected = view._refresh_item("riz")
+
+    assert affected == {"1", "3"}
+    assert percentages(view) == {"1": 50, "3": 50}
+    assert view.cookable_now() == []
+
+
+def test_cookable_and_use_soon(view):
+    view.add_item({"name": "riz", "quantity": 500, "unit": "g", "expirationDate": in_days(2)})
+    view.add_item({"name": "poulet", "quantity": 1, "unit": "kg", "expirationDate": in_days(10)})
+
+    assert [r["id"] for r in view.cookable_now()] == ["1"]
+    use_soon = view.use_soon()
+    assert [r["id"] for r in use_soon] == ["1", "3"]
+    assert use_soon[0]["daysUntilExpiration"] == 2
+
+
+def test_used_up_item_no_longer_counts(view):
+    item = view.add_item({"name": "riz", "quantity": 500, "unit": "g", "expirationDate": in_days(2)})
+    view.add_item({"name": "poulet", "quantity": 1, "unit": "kg", "expirationDate": in_days(10)})
+
+    view.update_item(item["id"], {"quantity": 0})
+
+    assert view.cookable_now() == []
+    assert view.use_soon() == []
+    assert percentages(view) == {"1": 50}
+
+
+def test_expired_items_do_not_count(view):
+    view.add_item({"name": "poulet", "quantity": 1, "unit": "kg", "expirationDate": in_days(-3)})
+    view.add_item({"name": "riz", "quantity": 500, "unit": "g", "expirationDate": in_days(5)})
+
+    assert view.cookable_now() == []
+    assert all(r["daysUntilExpiration"] >= 0 for r in view.use_soon())
+    assert percentages(view) == {"1": 50, "3": 50}
+
+
+def test_sweep_rescores_when_item_expires(view, clock):
+    view.add_item({"name": "riz", "quantity": 500, "unit": "g", "expirationDate": in_days(1)})
+    view.add_item({"name": "poulet", "quantity": 1, "unit": "kg", "expirationDate": in_days(10)})
+    assert [r["id"] for r in view.cookable_now()] == ["1"]
+
+    clock.today = TODAY + timedelta(days=1)
+    assert [r["id"] for r in view.cookable_now()] == ["1"]
+
+    clock.today = TODAY + timedelta(days=2)
+    assert view.cookable_now() == []
+    assert view.use_soon() == []
+    assert percentages(view) == {"1": 50}
+
+
+def test_catalog_resync_reindexes_changed_recipes_only(view):
+    view.add_item({"name": "oeuf", "quantity": 6, "unit": "pieces", "expirationDate": in_days(3)})
+
+    changed = [dict(RECIPES[0]), {"id": "3", "name": "Riz cantonais", "ingredients": ["riz"]}]
+    assert view.index_recipes(changed) == 1
+
+    view.set_recipes(RECIPES[:2])
+    assert set(view.recipes) == {"1", "2"}
+    assert "oeuf" not in view.ingredient_index
+    assert percentages(view) == {}
+    assert view.use_soon() == []
+
+
+def test_search_results_survive_catalog_resync(view):
+    view.index_recipes([{"id": "9", "name": "Omelette", "ingredients": ["oeuf"]}])
+    view.set_recipes(RECIPES)
+
+    view.add_item({"name": "oeufs", "quantity": 6, "unit": "pieces", "expirationDate": in_days(3)})
+    assert percentages(view) == {"3": 50, "9": 100}
+
+
+def test_matches_expose_matched_keys(view):
+    view.add_item({"name": "riz", "quantity": 500, "unit": "g", "expirationDate": in_days(2)})
+    view.add_item({"name": "poulet", "quantity": 1, "unit": "kg", "expirationDate": in_days(-1)})
+
+    assert view.matches()["1"] == {"matchPercentage": 50, "matchedKeys": ["riz"]}
+
+
+def test_search_results_are_capped(tmp_path, clock):
+    view = PantryView(str(tmp_path / "pantry.json"), clock=clock, max_search_results=2)
+    view.set_recipes(RECIPES)
+    view.add_item({"name": "oeuf", "quantity": 6, "unit": "pieces", "expirationDate": in_days(3)})
+
+    view.index_search_results([{"id": "9", "name": "Omelette", "ingredients": ["oeuf"]}])
+    view.index_search_results([{"id": "10", "name": "Oeuf dur", "ingredients": ["oeuf"]}])
+    # "9" redevient le plus récent, "10" est évincé au profit de "3" (déjà au catalogue)
+    view.index_search_results([{"id": "9", "name": "Omelette", "ingredients": ["oeuf"]}])
+    view.index_search_results([RECIPES[2]])
+
+    assert list(view.search_ids) == ["9", "3"]
+    assert "10" not in view.recipes
+    assert percentages(view) == {"3": 50, "9": 100}
+
+    # Une recette du catalogue évincée du LRU reste indexée
+    view.index_search_results([{"id": "11", "name": "Flan", "ingredients": ["oeuf", "lait"]}])
+    view.index_search_results([{"id": "12", "name": "Quiche", "ingredients": ["oeuf", "farine"]}])
+    assert "3" in view.recipes
+    assert "9" not in view.recipes
+
+
+def test_pantry_is_persisted(tmp_path, view, clock):
+    item = view.add_item({"name": "riz", "quantity": "500", "unit": "g", "expirationDate": in_days(2) + "T00:00:00.000Z"})
+
+    reloaded = PantryView(str(tmp_path / "pantry.json"), clock=clock)
+    assert reloaded.items == {item["id"]: item}
+    assert item["quantity"] == 500.0
+    assert item["expirationDate"] == in_days(2)
+
+
+def test_failed_save_leaves_state_unchanged(view, monkeypatch):
+    def fail(items):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(view, "save", fail)
+    with pytest.raises(OSError):
+        view.add_item({"name": "riz", "quantity": 1, "unit": "kg", "expirationDate": in_days(2)})
+
+    assert view.items == {}
+    assert percentages(view) == {}
+
+
+@pytest.mark.parametrize("payload", [
+    [1],
+    {"quantity": 1, "unit": "g", "expirationDate": "2025-08-21"},
+    {"name": "riz", "quantity": "nan", "unit": "g", "expirationDate": "2025-08-21"},
+    {"name": "riz", "quantity": "inf", "unit": "g", "expirationDate": "2025-08-21"},
+    {"name": "riz", "quantity": -1, "unit": "g", "expirationDate": "2025-08-21"},
+    {"name": "riz", "quantity": 1, "unit": "lb", "expirationDate": "2025-08-21"},
+    {"name": "riz", "quantity": 1, "unit": "g"},
+])
+def test_invalid_payloads_are_rejected(view, payload):
+    with pytest.raises(ValueError):
+        view.add_item(payload)
+    assert view.items == {}
+
+
+def test_validate_item_without_required_expiration():
+    item = validate_item({"name": "riz", "quantity": 1, "unit": "kg"}, require_expiration=False)
+    assert item["expirationDate"] is None
@@ -0,0 +1,137 @@
+from datetime import date
+
+import pytest
+
+from shopping import aggregate_needs, compute_deficit, parse_request, to_base
+
+TODAY = date(2025, 8, 20)
+
+
+def recipe(recipe_id, *ingredients):
+    return {
+        "id": recipe_id,
+        "ingredientDetails": [
+            {"name": name, "quantity": quantity, "unit": unit, "isOptional": optional}
+            for name, quantity, unit, optional in ingredients
+        ]
+    }
+
+
+RIZ_LAIT = recipe("1", ("Riz", 100, "g", False), ("Lait", 10, "cl", False), ("Persil", 1, "botte", True))
+RIZ_OEUF = recipe("2", ("Riz", 0.2, "Kg", False), ("Oeuf", 1, "Pièce", False))
+
+
+@pytest.mark.parametrize("quantity, unit, expected", [
+    (1, "Kg", ("mass", 1000, "g")),
+    (2, "cl", ("volume", 20, "ml")),
+    (1, "L", ("volume", 1000, "ml")),
+    (1, "c. à soupe", ("volume", 15, "ml")),
+    (3, "Pièce", ("count", 3, "pieces")),
+    (2, "gousse", ("unit:gousse", 2, "gousse")),
+])
+def test_to_base(quantity, unit, expected):
+    assert to_base(quantity, unit) == expected
+
+
+def test_aggregate_needs_merges_units_across_recipes():
+    needs = aggregate_needs([(RIZ_LAIT, 2), (RIZ_OEUF, 2)])
+
+    assert needs[("riz", "mass")]["needed"] == 600
+    assert needs[("riz", "mass")]["recipes"] == ["1", "2"]
+    assert needs[("lait", "volume")]["needed"] == 200
+    assert needs[("oeuf", "count")]["needed"] == 2
+    assert ("persil", "unit:botte") not in needs
+
+    with_optional = aggregate_needs([(RIZ_LAIT, 2)], include_optional=True)
+    assert with_optional[("persil", "unit:botte")]["needed"] == 2
+
+
+def test_deficit_subtracts_pantry_in_base_units():
+    needs = aggregate_needs([(RIZ_LAIT, 2), (RIZ_OEUF, 2)])
+    pantry = [
+        {"name": "riz", "quantity": 0.25, "unit": "kg", "expirationDate": "2025-08-25"},
+        {"name": "lait", "quantity": 0.5, "unit": "l", "expirationDate": "2025-08-25"},
+    ]
+
+    deficit = {d["name"]: d for d in compute_deficit(needs, pantry, today=TODAY)}
+
+    assert set(deficit) == {"Riz", "Oeuf"}
+    assert deficit["Riz"]["available"] == 250
+    assert deficit["Riz"]["missing"] == 350
+
+
+def test_stock_is_consumed_only_once():
+    needs = aggregate_needs([(recipe("1", ("Riz", 300, "g", False), ("Riz basmati", 300, "g", False)), 1)])
+    pantry = [{"name": "riz", "quantity": 400, "unit": "g", "expirationDate": None}]
+
+    deficit = compute_deficit(needs, pantry, today=TODAY)
+
+    # "Riz" prend 300 g, il en reste 100 g pour "Riz basmati"
+    assert [(d["name"], d["available"], d["missing"]) for d in deficit] == [("Riz basmati", 100, 200)]
+
+
+def test_exact_names_are_served_before_similar_ones():
+    needs = aggregate_needs([(recipe("1", ("Chorizo", 200, "g", False), ("Riz", 200, "g", False)), 1)])
+    pantry = [{"name": "riz", "quantity": 200, "unit": "g", "expirationDate": None}]
+
+    deficit = compute_deficit(needs, pantry, today=TODAY)
+
+    assert [(d["name"], d["available"], d["missing"]) for d in deficit] == [("Chorizo", 0, 200)]
+
+
+def test_similar_names_share_leftover_stock():
+    needs = aggregate_needs([(recipe("1", ("Riz basmati", 200, "g", False), ("Oeuf", 2, "pièce", False)), 1)])
+    pantry = [
+        {"name": "riz", "quantity": 500, "unit": "g", "expirationDate": None},
+        {"name": "Oeufs", "quantity": 6, "unit": "pièces", "expirationDate": None},
+    ]
+
+    assert compute_deficit(needs, pantry, today=TODAY) == []
+
+
+def test_expired_and_used_up_stock_is_ignored():
+    needs = aggregate_needs([(RIZ_LAIT, 1)])
+    pantry = [
+        {"name": "riz", "quantity": 500, "unit": "g", "expirationDate": "2025-08-19"},
+        {"name": "lait", "quantity": 0, "unit": "l", "expirationDate": "2025-08-25"},
+    ]
+
+    deficit = compute_deficit(needs, pantry, today=TODAY)
+    assert [d["available"] for d in deficit] == [0, 0]
+
+
+def test_parse_request_plan_and_client_pantry():
+    recipe_ids, covers, include_optional, pantry = parse_request({
+        "recipeIds": [7],
+        "plan": [{"day": "monday", "lunch": {"id": "1"}, "dinner": None}, {"day": "tuesday"}],
+        "covers": 4,
+        "pantry": [{"name": "riz", "quantity": "500", "unit": "g"}],
+    })
+
+    assert recipe_ids == ["7", "1"]
+    assert covers == 4
+    assert include_optional is False
+    assert pantry[0]["quantity"] == 500.0
+    assert pantry[0]["expirationDate"] is None
+
+    deficit = compute_deficit(aggregate_needs([(RIZ_LAIT, 2)]), pantry, today=TODAY)
+    assert "Riz" not in [d["name"] for d in deficit]
+
+
+@pytest.mark.parametrize("payload", [
+    [1],
+    {},
+    {"recipeIds": "12"},
+    {"recipeIds": [None]},
+    {"plan": [{"lunch": "1"}]},
+    {"plan": ["monday"]},
+    {"recipeIds": ["1"], "covers": 0},
+    {"recipeIds": ["1"], "covers": True},
+    {"recipeIds": ["1"], "includeOptional": "false"},
+    {"recipeIds": ["1"], "includeOptional": 1},
+    {"recipeIds": ["1"], "pantry": [{"name": "riz", "quantity": "x", "unit": "g"}]},
+    {"recipeIds": ["1"], "pantry": {"name": "riz"}},
+])
+def test_parse_request_rejects_invalid_payloads(payload):
+    with pytest.raises(ValueError):
+        parse_request(payload)
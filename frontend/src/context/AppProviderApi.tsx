@@ -1,8 +1,8 @@
-import React, { createContext, useContext, useState, useMemo } from 'react';
+import React, { createContext, useContext, useState, useMemo, useEffect } from 'react';
 import type { ReactNode } from 'react';
 import { useLocalStorage } from '../utils/useLocalStorage';
-import { useRecipes, useApiHealth } from '../services/apiHooks';
-import { ApiError } from '../services/apiService';
+import { useRecipes, useApiHealth, usePantry } from '../services/apiHooks';
+import { ApiError, type PantryMatch, type PantryRecipeScore } from '../services/apiService';
 import type { Ingredient, Recipe, WeeklyPlan } from '../types/types';
 
 interface AppContextType {
@@ -12,6 +12,12 @@ interface AppContextType {
    weeklyPlan: WeeklyPlan[];
    selectedRecipes: Recipe[];
    
+   // Vue matérialisée du garde-manger, maintenue par le backend
+   pantryMatches: Record<string, PantryMatch>;
+   cookableNow: PantryRecipeScore[];
+   useSoon: PantryRecipeScore[];
+   isIngredientOwned: (recipeId: string, ingredient: string) => boolean;
+   
    // États de loading et d'erreur
    recipesLoading: boolean;
    recipesError: ApiError | null;
@@ -54,49 +60,15 @@ export const AppProvider: React.FC<AppProviderProps> = ({ children }) => {
    // État de recherche
    const [searchQuery, setSearchQuery] = useState<string>('');
    
-   // Ingrédients stockés localement avec des exemples par défaut
-   const [ingredients, setIngredients] = useLocalStorage<Ingredient[]>('ingredients', [
-      {
-         id: '1',
-         name: 'Tomates',
-         quantity: 500,
-         unit: 'g',
-         expirationDate: new Date(Date.now() + 5 * 24 * 60 * 60 * 1000),
-         addedDate: new Date()
-      },
-      {
-         id: '2',
-         name: 'Pâtes',
-         quantity: 400,
-         unit: 'g',
-         expirationDate: new Date(Date.now() + 30 * 24 * 60 * 60 * 1000),
-         addedDate: new Date()
-      },
-      {
-         id: '3',
-         name: 'Œufs',
-         quantity: 6,
-         unit: 'pieces',
-         expirationDate: new Date(Date.now() + 7 * 24 * 60 * 60 * 1000),
-         addedDate: new Date()
-      },
-      {
-         id: '4',
-         name: 'Bœuf haché',
-         quantity: 500,
-         unit: 'g',
-         expirationDate: new Date(Date.now() + 3 * 24 * 60 * 60 * 1000),
-         addedDate: new Date()
-      },
-      {
-         id: '5',
-         name: 'Oignons',
-         quantity: 2,
-         unit: 'pieces',
-         expirationDate: new Date(Date.now() + 14 * 24 * 60 * 60 * 1000),
-         addedDate: new Date()
-      }
-   ]);
+   // Garde-manger persisté côté serveur
+   const {
+      items: ingredients,
+      view: pantryView,
+      addItem,
+      updateItem,
+      removeItem,
+      refreshView: refreshPantryView
+   } = usePantry();
    
    // Santé de l'API
    const { isHealthy: apiHealthy } = useApiHealth();
@@ -121,32 +93,36 @@ export const AppProvider: React.FC<AppProviderProps> = ({ children }) => {
    // Récupération des recettes depuis l'API sans limite
    const { recipes: apiRecipes, loading: recipesLoading, error: recipesError, refetch: refreshRecipes } = useRecipes(effectiveSearchQuery);
    
+   // Les résultats de recherche sont scorés par le backend : rafraîchir la vue quand ils changent
+   useEffect(() => {
+      if (apiRecipes) {
+         refreshPantryView();
+      }
+   }, [apiRecipes, refreshPantryView]);
+   
    // Planning hebdomadaire stocké localement
    const [weeklyPlan, setWeeklyPlan] = useLocalStorage<WeeklyPlan[]>('weeklyPlan', []);
    
    // Recettes sélectionnées stockées localement
    const [selectedRecipes, setSelectedRecipes] = useLocalStorage<Recipe[]>('selectedRecipes', []);
 
-   // Actions pour les ingrédients
+   // Actions pour les ingrédients (le backend met à jour les scores des recettes concernées)
    const addIngredient = (ingredient: Omit<Ingredient, 'id' | 'addedDate'>) => {
-      const newIngredient: Ingredient = {
-         ...ingredient,
-         id: Date.now().toString(),
-         addedDate: new Date(),
-      };
-      setIngredients([...ingredients, newIngredient]);
+      addItem(ingredient);
    };
 
    const removeIngredient = (id: string) => {
-      setIngredients(ingredients.filter(ing => ing.id !== id));
+      removeItem(id);
    };
 
    const updateIngredient = (id: string, updates: Partial<Ingredient>) => {
-      setIngredients(ingredients.map(ing => 
-         ing.id === id ? { ...ing, ...updates } : ing
-      ));
+      updateItem(id, updates);
    };
 
+   // Ingrédient couvert par le garde-manger selon le backend (articles périmés exclus)
+   const isIngredientOwned = (recipeId: string, ingredient: string) =>
+      pantryView.matches[recipeId]?.matchedKeys.includes(ingredient.trim().toLowerCase()) ?? false;
+
    // Actions pour les recettes sélectionnées
    const addSelectedRecipe = (recipe: Recipe) => {
       if (!selectedRecipes.some(r => r.id === recipe.id)) {
@@ -178,6 +154,12 @@ export const AppProvider: React.FC<AppProviderProps> = ({ children }) => {
          weeklyPlan,
          selectedRecipes,
          
+         // Vue matérialisée du garde-manger
+         pantryMatches: pantryView.matches,
+         cookableNow: pantryView.cookableNow,
+         useSoon: pantryView.useSoon,
+         isIngredientOwned,
+         
          // États de loading et d'erreur
          recipesLoading,
          recipesError,
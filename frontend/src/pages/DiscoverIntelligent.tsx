@@ -1,4 +1,4 @@
-import React, { useState, useMemo, useCallback } from 'react';
+import React, { useState, useMemo } from 'react';
 import { useAppContext } from '../context/AppProviderApi';
 import type { Recipe } from '../types/types';
 
@@ -13,7 +13,8 @@ const DiscoverIntelligent: React.FC<DiscoverIntelligentProps> = ({ onNavigate })
       recipesLoading,
       recipesError,
       recipes,
-      ingredients,
+      pantryMatches,
+      isIngredientOwned,
       selectedRecipes,
       addSelectedRecipe,
       removeSelectedRecipe
@@ -94,24 +95,6 @@ const DiscoverIntelligent: React.FC<DiscoverIntelligentProps> = ({ onNavigate })
       ]
    }), []);
 
-   // Calculer le pourcentage d'ingrédients possédés pour chaque recette
-   const getRecipeMatchPercentage = useCallback((recipe: Recipe) => {
-      if (recipe.ingredients.length === 0) return 0;
-
-      let matchCount = 0;
-      recipe.ingredients.forEach(recipeIngredient => {
-         const hasIngredient = ingredients.some(pantryIngredient =>
-            pantryIngredient.quantity > 0 && (
-               pantryIngredient.name.toLowerCase().includes(recipeIngredient.toLowerCase()) ||
-               recipeIngredient.toLowerCase().includes(pantryIngredient.name.toLowerCase())
-            )
-         );
-         if (hasIngredient) matchCount++;
-      });
-
-      return Math.round((matchCount / recipe.ingredients.length) * 100);
-   }, [ingredients]);
-
    // Filtrer et trier les recettes pour les résultats de recherche
    const searchResults = useMemo(() => {
       if (!recipes || !showResults) return [];
@@ -119,7 +102,7 @@ const DiscoverIntelligent: React.FC<DiscoverIntelligentProps> = ({ onNavigate })
       const filteredRecipes = recipes
          .map(recipe => ({
             ...recipe,
-            matchPercentage: getRecipeMatchPercentage(recipe)
+            matchPercentage: pantryMatches[recipe.id]?.matchPercentage ?? 0 // Maintenu de façon incrémentale par le backend
          }))
          .filter(recipe => {
             // Si on a une catégorie d'ingrédients spécifique, filtrer plus précisément
@@ -151,7 +134,7 @@ const DiscoverIntelligent: React.FC<DiscoverIntelligentProps> = ({ onNavigate })
          .sort((a, b) => b.matchPercentage - a.matchPercentage); // Trier par pourcentage de correspondance décroissant
 
       return filteredRecipes;
-   }, [recipes, showResults, getRecipeMatchPercentage, selectedCategory, ingredientCategories]);
+   }, [recipes, showResults, pantryMatches, selectedCategory, ingredientCategories]);
 
    const isSelected = (recipe: Recipe) => {
       return selectedRecipes.some(selected => selected.id === recipe.id);
@@ -455,12 +438,7 @@ const DiscoverIntelligent: React.FC<DiscoverIntelligentProps> = ({ onNavigate })
                                        gap: '0.35rem'
                                     }}>
                                        {recipe.ingredients.slice(0, 8).map((ingredient, index) => {
-                                          const hasIngredient = ingredients.some(pantryIngredient =>
-                                             pantryIngredient.quantity > 0 && (
-                                                pantryIngredient.name.toLowerCase().includes(ingredient.toLowerCase()) ||
-                                                ingredient.toLowerCase().includes(pantryIngredient.name.toLowerCase())
-                                             )
-                                          );
+                                          const hasIngredient = isIngredientOwned(recipe.id, ingredient);
 
                                           return (
                                              <span
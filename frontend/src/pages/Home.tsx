@@ -1,4 +1,4 @@
-import React, { useMemo, useCallback } from 'react';
+import React, { useMemo } from 'react';
 import { useAppContext } from '../context/AppProviderApi';
 import type { Recipe } from '../types/types';
 
@@ -10,6 +10,10 @@ export default function Home({ onNavigate }: HomeProps): React.ReactElement {
   const {
     ingredients,
     recipes,
+    pantryMatches,
+    isIngredientOwned,
+    cookableNow,
+    useSoon,
     selectedRecipes,
     addSelectedRecipe,
     removeSelectedRecipe,
@@ -18,24 +22,6 @@ export default function Home({ onNavigate }: HomeProps): React.ReactElement {
     refreshRecipes
   } = useAppContext();
 
-  // Calculer le pourcentage d'ingrédients possédés pour chaque recette
-  const getRecipeMatchPercentage = useCallback((recipe: Recipe) => {
-    if (recipe.ingredients.length === 0) return 0;
-
-    let matchCount = 0;
-    recipe.ingredients.forEach(recipeIngredient => {
-      const hasIngredient = ingredients.some(pantryIngredient =>
-        pantryIngredient.quantity > 0 && (
-          pantryIngredient.name.toLowerCase().includes(recipeIngredient.toLowerCase()) ||
-          recipeIngredient.toLowerCase().includes(pantryIngredient.name.toLowerCase())
-        )
-      );
-      if (hasIngredient) matchCount++;
-    });
-
-    return Math.round((matchCount / recipe.ingredients.length) * 100);
-  }, [ingredients]);
-
   // Filtrer les recettes selon les ingrédients disponibles (seulement celles avec des correspondances)
   const filteredRecipes = useMemo(() => {
     if (!recipes) return [];
@@ -44,11 +30,17 @@ export default function Home({ onNavigate }: HomeProps): React.ReactElement {
     return recipes
       .map(recipe => ({
         ...recipe,
-        matchPercentage: getRecipeMatchPercentage(recipe)
+        matchPercentage: pantryMatches[recipe.id]?.matchPercentage ?? 0 // Maintenu de façon incrémentale par le backend
       }))
       .filter(recipe => recipe.matchPercentage > 0) // Seulement les recettes avec correspondances
       .sort((a, b) => b.matchPercentage - a.matchPercentage); // Trier par pourcentage décroissant
-  }, [recipes, getRecipeMatchPercentage]);
+  }, [recipes, pantryMatches]);
+
+  // Recettes à cuisiner en priorité : ingrédients bientôt périmés d'abord, puis celles faisables tout de suite
+  const urgentRecipes = useMemo(() => {
+    const soonIds = new Set(useSoon.map(recipe => recipe.id));
+    return [...useSoon, ...cookableNow.filter(recipe => !soonIds.has(recipe.id))].slice(0, 6);
+  }, [cookableNow, useSoon]);
 
   const isSelected = (recipe: Recipe) => {
     return selectedRecipes.some(selected => selected.id === recipe.id);
@@ -199,6 +191,55 @@ export default function Home({ onNavigate }: HomeProps): React.ReactElement {
         )}
       </div>
 
+      {/* À cuisiner vite : vue calculée par le backend */}
+      {urgentRecipes.length > 0 && (
+        <div style={{
+          backgroundColor: '#fff8e1',
+          border: '1px solid #ffe082',
+          borderRadius: '12px',
+          padding: '1.25rem 1.5rem',
+          marginBottom: '2rem'
+        }}>
+          <h2 style={{ fontSize: '1.2rem', marginBottom: '1rem', color: '#495057' }}>
+            ⏰ À cuisiner vite
+          </h2>
+          <div style={{
+            display: 'flex',
+            flexWrap: 'wrap',
+            gap: '0.75rem'
+          }}>
+            {urgentRecipes.map(recipe => (
+              <button
+                key={recipe.id}
+                onClick={() => onNavigate?.('recipe-detail', { recipeId: recipe.id })}
+                style={{
+                  display: 'flex',
+                  flexDirection: 'column',
+                  alignItems: 'flex-start',
+                  gap: '0.25rem',
+                  padding: '0.75rem 1rem',
+                  backgroundColor: 'white',
+                  border: '1px solid #ffe082',
+                  borderRadius: '8px',
+                  cursor: 'pointer',
+                  textAlign: 'left'
+                }}
+              >
+                <span style={{ fontWeight: '500', color: '#333' }}>{recipe.name}</span>
+                <span style={{ fontSize: '0.8rem', color: '#6c757d' }}>
+                  {recipe.daysUntilExpiration !== undefined
+                    ? recipe.daysUntilExpiration === 0
+                      ? "Expire aujourd'hui"
+                      : `Expire dans ${recipe.daysUntilExpiration} jour${recipe.daysUntilExpiration > 1 ? 's' : ''}`
+                    : 'Tous les ingrédients disponibles'}
+                  {' • '}{recipe.matchPercentage}%
+                </span>
+              </button>
+            ))}
+          </div>
+        </div>
+      )}
+
       {/* Message d'état si pas de recettes */}
       {statusMessage && (
         <div style={{
@@ -350,12 +391,7 @@ export default function Home({ onNavigate }: HomeProps): React.ReactElement {
                       gap: '0.25rem'
                     }}>
                       {recipe.ingredients.slice(0, 6).map((ingredient, index) => {
-                        const hasIngredient = ingredients.some(pantryIngredient =>
-                          pantryIngredient.quantity > 0 && (
-                            pantryIngredient.name.toLowerCase().includes(ingredient.toLowerCase()) ||
-                            ingredient.toLowerCase().includes(pantryIngredient.name.toLowerCase())
-                          )
-                        );
+                        const hasIngredient = isIngredientOwned(recipe.id, ingredient);
 
                         return (
                           <span
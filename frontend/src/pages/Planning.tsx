@@ -1,5 +1,6 @@
 import React, { useState } from 'react';
 import { useAppContext } from '../context/AppProviderApi';
+import { useShoppingList } from '../services/apiHooks';
 import type { Recipe, WeeklyPlan } from '../types/types';
 
 type DayOfWeek = 'monday' | 'tuesday' | 'wednesday' | 'thursday' | 'friday' | 'saturday' | 'sunday';
@@ -9,6 +10,7 @@ export default function Planning(): React.ReactElement {
    const { weeklyPlan, updateWeeklyPlan, selectedRecipes } = useAppContext();
    const [searchTerm, setSearchTerm] = useState('');
    const [difficultyFilter, setDifficultyFilter] = useState<'all' | 'easy' | 'medium' | 'hard'>('all');
+   const shoppingList = useShoppingList();
 
    const days: { id: DayOfWeek; label: string; shortLabel: string }[] = [
       { id: 'monday', label: 'Lundi', shortLabel: 'Lun' },
@@ -473,6 +475,45 @@ export default function Planning(): React.ReactElement {
                               <div>Moyenne par repas: {Math.round(getTotalPrepTime() / getTotalMealsPlanned())} min</div>
                            </div>
                         </div>
+
+                        <div>
+                           <h4 style={{ color: '#ffc107', marginBottom: '0.5rem' }}>Liste de courses</h4>
+                           <button
+                              onClick={() => shoppingList.generate(weeklyPlan)}
+                              disabled={shoppingList.loading}
+                              style={{
+                                 padding: '0.5rem 1rem',
+                                 backgroundColor: '#ffc107',
+                                 color: 'white',
+                                 border: 'none',
+                                 borderRadius: '4px',
+                                 cursor: shoppingList.loading ? 'wait' : 'pointer',
+                                 marginBottom: '0.5rem'
+                              }}
+                           >
+                              {shoppingList.loading ? 'Calcul...' : '🛒 Générer la liste'}
+                           </button>
+                           {shoppingList.error && (
+                              <div style={{ fontSize: '0.9rem', color: '#dc3545' }}>{shoppingList.error.message}</div>
+                           )}
+                           {shoppingList.items && (
+                              <ul style={{ listStyle: 'none', padding: 0, margin: 0 }}>
+                                 {shoppingList.items.length === 0 && (
+                                    <li style={{ fontSize: '0.9rem', color: '#666' }}>Tout est déjà dans le garde-manger !</li>
+                                 )}
+                                 {shoppingList.items.map(item => (
+                                    <li key={`${item.name}-${item.unit}`} style={{ marginBottom: '0.25rem', fontSize: '0.9rem' }}>
+                                       • {item.name} : {item.missing} {item.unit}
+                                    </li>
+                                 ))}
+                              </ul>
+                           )}
+                           {shoppingList.missingRecipes.length > 0 && (
+                              <div style={{ fontSize: '0.8rem', color: '#666', marginTop: '0.5rem' }}>
+                                 {shoppingList.missingRecipes.length} recette(s) introuvable(s) côté serveur, non incluse(s)
+                              </div>
+                           )}
+                        </div>
                      </div>
                   </div>
                )}
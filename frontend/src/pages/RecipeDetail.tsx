@@ -13,7 +13,8 @@ export default function RecipeDetail({ recipeId, onNavigate }: RecipeDetailProps
       selectedRecipes,
       addSelectedRecipe,
       removeSelectedRecipe,
-      ingredients,
+      pantryMatches,
+      isIngredientOwned,
       recipesLoading,
       recipesError
    } = useAppContext();
@@ -40,24 +41,6 @@ export default function RecipeDetail({ recipeId, onNavigate }: RecipeDetailProps
       }
    };
 
-   // Calculer le pourcentage d'ingrédients possédés
-   const getRecipeMatchPercentage = (recipe: Recipe) => {
-      if (recipe.ingredients.length === 0) return 0;
-
-      let matchCount = 0;
-      recipe.ingredients.forEach(recipeIngredient => {
-         const hasIngredient = ingredients.some(pantryIngredient =>
-            pantryIngredient.quantity > 0 && (
-               pantryIngredient.name.toLowerCase().includes(recipeIngredient.toLowerCase()) ||
-               recipeIngredient.toLowerCase().includes(pantryIngredient.name.toLowerCase())
-            )
-         );
-         if (hasIngredient) matchCount++;
-      });
-
-      return Math.round((matchCount / recipe.ingredients.length) * 100);
-   };
-
    if (recipesLoading) {
       return (
          <div style={{
@@ -159,7 +142,9 @@ export default function RecipeDetail({ recipeId, onNavigate }: RecipeDetailProps
       );
    }
 
-   const matchPercentage = getRecipeMatchPercentage(recipe);
+   // Correspondance avec le garde-manger, maintenue par le backend
+   const matchPercentage = pantryMatches[recipe.id]?.matchPercentage ?? 0;
+   const missingCount = recipe.ingredients.filter(ingredient => !isIngredientOwned(recipe.id, ingredient)).length;
 
    return (
       <div style={{
@@ -336,12 +321,7 @@ export default function RecipeDetail({ recipeId, onNavigate }: RecipeDetailProps
                gap: '0.75rem'
             }}>
                {recipe.ingredients.map((ingredient, index) => {
-                  const hasIngredient = ingredients.some(pantryIngredient =>
-                     pantryIngredient.quantity > 0 && (
-                        pantryIngredient.name.toLowerCase().includes(ingredient.toLowerCase()) ||
-                        ingredient.toLowerCase().includes(pantryIngredient.name.toLowerCase())
-                     )
-                  );
+                  const hasIngredient = isIngredientOwned(recipe.id, ingredient);
 
                   return (
                      <div
@@ -388,7 +368,7 @@ export default function RecipeDetail({ recipeId, onNavigate }: RecipeDetailProps
                })}
             </div>
 
-            {matchPercentage < 100 && (
+            {missingCount > 0 && (
                <div style={{
                   marginTop: '1.5rem',
                   padding: '1rem',
@@ -397,7 +377,7 @@ export default function RecipeDetail({ recipeId, onNavigate }: RecipeDetailProps
                   textAlign: 'center'
                }}>
                   <p style={{ color: '#495057', marginBottom: '1rem' }}>
-                     Il vous manque {recipe.ingredients.length - Math.floor(recipe.ingredients.length * matchPercentage / 100)} ingrédients
+                     Il vous manque {missingCount} ingrédient{missingCount > 1 ? 's' : ''}
                   </p>
                   <button
                      onClick={() => onNavigate?.('pantry')}
@@ -1,6 +1,6 @@
 import { useState, useEffect, useCallback } from 'react';
-import { apiService, handleApiError, createInitialApiState, type ApiState } from '../services/apiService';
-import type { Recipe } from '../types/types';
+import { apiService, handleApiError, createInitialApiState, type ApiState, type ApiError, type PantryItem, type PantryMatch, type PantryRecipeScore, type ShoppingListItem } from '../services/apiService';
+import type { Ingredient, Recipe, WeeklyPlan } from '../types/types';
 
 // Hook pour récupérer toutes les recettes
 export const useRecipes = (searchQuery?: string, limit?: number) => {
@@ -206,3 +206,150 @@ export const useApiHealth = () => {
     isHealthy: state.data?.status === 'healthy'
   };
 };
+
+// Conversion d'un article du garde-manger serveur vers le type du frontend
+const toIngredient = (item: PantryItem): Ingredient => ({
+  ...item,
+  expirationDate: new Date(item.expirationDate),
+  addedDate: new Date(item.addedDate),
+});
+
+export interface PantryRecipesView {
+  cookableNow: PantryRecipeScore[];
+  useSoon: PantryRecipeScore[];
+  matches: Record<string, PantryMatch>;
+}
+
+const emptyPantryView: PantryRecipesView = { cookableNow: [], useSoon: [], matches: {} };
+
+// Hook pour le garde-manger persistant côté serveur et sa vue matérialisée :
+// les scores sont recalculés de façon incrémentale par le backend à chaque modification
+export const usePantry = () => {
+  const [items, setItems] = useState<Ingredient[]>([]);
+  const [view, setView] = useState<PantryRecipesView>(emptyPantryView);
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState<ApiError | null>(null);
+
+  const refreshView = useCallback(async () => {
+    try {
+      const response = await apiService.getPantryRecipes();
+      setView(response.data);
+    } catch (error) {
+      setError(handleApiError(error, 'usePantry'));
+    }
+  }, []);
+
+  const fetchPantry = useCallback(async () => {
+    setLoading(true);
+    try {
+      let response = await apiService.getPantry();
+
+      // Migration de l'ancien garde-manger stocké dans le navigateur : fusion par nom
+      // pour qu'une migration interrompue reprenne sans doublons au prochain chargement
+      const legacy = window.localStorage.getItem('ingredients');
+      if (legacy) {
+        const legacyItems: Omit<Ingredient, 'id' | 'addedDate'>[] = JSON.parse(legacy);
+        const normalize = (name: string) => name.trim().toLowerCase();
+        const serverNames = new Set(response.data.map(item => normalize(item.name)));
+        const missingItems = legacyItems.filter(item => !serverNames.has(normalize(item.name)));
+
+        for (const item of missingItems) {
+          await apiService.addPantryItem(item);
+        }
+        if (missingItems.length > 0) {
+          response = await apiService.getPantry();
+        }
+        // Supprimé seulement quand tous les articles sont sur le serveur
+        window.localStorage.removeItem('ingredients');
+      }
+
+      setItems(response.data.map(toIngredient));
+      setError(null);
+      await refreshView();
+    } catch (error) {
+      setError(handleApiError(error, 'usePantry'));
+    } finally {
+      setLoading(false);
+    }
+  }, [refreshView]);
+
+  useEffect(() => {
+    fetchPantry();
+  }, [fetchPantry]);
+
+  const addItem = useCallback(async (ingredient: Omit<Ingredient, 'id' | 'addedDate'>) => {
+    try {
+      const response = await apiService.addPantryItem(ingredient);
+      setItems(prev => [...prev, toIngredient(response.data)]);
+      await refreshView();
+    } catch (error) {
+      setError(handleApiError(error, 'usePantry'));
+    }
+  }, [refreshView]);
+
+  const updateItem = useCallback(async (id: string, changes: Partial<Ingredient>) => {
+    try {
+      const response = await apiService.updatePantryItem(id, changes);
+      setItems(prev => prev.map(item => item.id === id ? toIngredient(response.data) : item));
+      await refreshView();
+    } catch (error) {
+      setError(handleApiError(error, 'usePantry'));
+    }
+  }, [refreshView]);
+
+  const removeItem = useCallback(async (id: string) => {
+    try {
+      await apiService.removePantryItem(id);
+      setItems(prev => prev.filter(item => item.id !== id));
+      await refreshView();
+    } catch (error) {
+      setError(handleApiError(error, 'usePantry'));
+    }
+  }, [refreshView]);
+
+  return {
+    items,
+    view,
+    loading,
+    error,
+    addItem,
+    updateItem,
+    removeItem,
+    refreshView,
+    refetch: fetchPantry
+  };
+};
+
+// Hook pour la liste de courses : une seule requête, l'agrégation est faite par le backend
+export const useShoppingList = () => {
+  const [state, setState] = useState<ApiState<ShoppingListItem[]>>(createInitialApiState);
+  const [missingRecipes, setMissingRecipes] = useState<string[]>([]);
+
+  const generate = useCallback(async (plan: WeeklyPlan[]) => {
+    setState(prev => ({ ...prev, loading: true, error: null }));
+
+    try {
+      const response = await apiService.getShoppingList(plan);
+      setState({
+        data: response.data,
+        loading: false,
+        error: null
+      });
+      setMissingRecipes(response.missingRecipes);
+    } catch (error) {
+      setState({
+        data: null,
+        loading: false,
+        error: handleApiError(error, 'useShoppingList')
+      });
+    }
+  }, []);
+
+  return {
+    items: state.data,
+    missingRecipes,
+    loading: state.loading,
+    error: state.error,
+    generate
+  };
+};
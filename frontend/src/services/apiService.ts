@@ -1,4 +1,4 @@
-import type { Recipe } from '../types/types';
+import type { Ingredient, Recipe, WeeklyPlan } from '../types/types';
 
 const API_BASE_URL = 'http://localhost:5000';
 
@@ -29,6 +29,55 @@ interface HealthResponse extends ApiResponse<{
   // Interface étendue pour la réponse de santé
 }
 
+// Ingrédient tel que stocké par le garde-manger du backend (dates ISO)
+export interface PantryItem extends Omit<Ingredient, 'expirationDate' | 'addedDate'> {
+  expirationDate: string;
+  addedDate: string;
+}
+
+export interface PantryRecipeScore {
+  id: string;
+  name: string;
+  image?: string;
+  prepTime?: number;
+  matchPercentage: number;
+  matchedIngredients: number;
+  matchedKeys: string[];
+  totalIngredients: number;
+  soonestExpiration: string | null;
+  daysUntilExpiration?: number;
+}
+
+// Correspondance d'une recette avec le garde-manger (articles non périmés uniquement)
+export interface PantryMatch {
+  matchPercentage: number;
+  matchedKeys: string[]; // noms d'ingrédients normalisés (minuscules, sans espaces autour)
+}
+
+interface PantryRecipesResponse extends ApiResponse<{
+  cookableNow: PantryRecipeScore[];
+  useSoon: PantryRecipeScore[];
+  matches: Record<string, PantryMatch>; // id de recette -> correspondance (> 0 uniquement)
+}> {
+  // Vue matérialisée calculée par le backend
+}
+
+// Article manquant de la liste de courses (quantités en g, ml ou pièces)
+export interface ShoppingListItem {
+  name: string;
+  unit: string;
+  needed: number;
+  available: number;
+  missing: number;
+  recipes: string[];
+}
+
+interface ShoppingListResponse extends ApiResponse<ShoppingListItem[]> {
+  total: number;
+  recipesCount: number;
+  missingRecipes: string[];
+}
+
 // Classe pour gérer les appels API
 class ApiService {
   private baseUrl: string;
@@ -123,6 +172,56 @@ class ApiService {
     return this.request<SearchResponse>(`/api/recipes?${searchParams.toString()}`);
   }
 
+  // Garde-manger persistant côté serveur
+  async getPantry(): Promise<ApiResponse<PantryItem[]>> {
+    return this.request<ApiResponse<PantryItem[]>>('/api/pantry');
+  }
+
+  async addPantryItem(item: Omit<Ingredient, 'id' | 'addedDate'>): Promise<ApiResponse<PantryItem>> {
+    return this.request<ApiResponse<PantryItem>>('/api/pantry', {
+      method: 'POST',
+      body: JSON.stringify(item),
+    });
+  }
+
+  async updatePantryItem(id: string, changes: Partial<Omit<Ingredient, 'id'>>): Promise<ApiResponse<PantryItem>> {
+    return this.request<ApiResponse<PantryItem>>(`/api/pantry/${id}`, {
+      method: 'PUT',
+      body: JSON.stringify(changes),
+    });
+  }
+
+  async removePantryItem(id: string): Promise<ApiResponse<null>> {
+    return this.request<ApiResponse<null>>(`/api/pantry/${id}`, {
+      method: 'DELETE',
+    });
+  }
+
+  // Recettes cuisinables maintenant / à cuisiner vite (mise à jour incrémentale côté serveur)
+  async getPantryRecipes(params?: { limit?: number; days?: number }): Promise<PantryRecipesResponse> {
+    const searchParams = new URLSearchParams();
+
+    if (params?.limit) searchParams.append('limit', params.limit.toString());
+    if (params?.days) searchParams.append('days', params.days.toString());
+
+    const query = searchParams.toString();
+    return this.request<PantryRecipesResponse>(`/api/pantry/recipes${query ? `?${query}` : ''}`);
+  }
+
+  // Liste de courses agrégée côté serveur pour un planning
+  async getShoppingList(plan: WeeklyPlan[], options?: {
+    covers?: number;
+    includeOptional?: boolean;
+  }): Promise<ShoppingListResponse> {
+    return this.request<ShoppingListResponse>('/api/shopping-list', {
+      method: 'POST',
+      body: JSON.stringify({
+        plan: plan.map(day => ({ day: day.day, lunch: day.lunch && { id: day.lunch.id }, dinner: day.dinner && { id: day.dinner.id } })),
+        ...options,
+      }),
+    });
+  }
+
   // Récupérer les ingrédients (fonctionnalité future)
   async getIngredients(): Promise<ApiResponse<unknown[]>> {
     return this.request<ApiResponse<unknown[]>>('/api/ingredients');
@@ -7,11 +7,19 @@ export interface Ingredient {
    addedDate: Date;
 }
 
+export interface RecipeIngredient {
+   name: string;
+   quantity: number;
+   unit: string;
+   isOptional: boolean;
+}
+
 export interface Recipe {
    id: string;
    name: string;
    description: string;
    ingredients: string[];
+   ingredientDetails?: RecipeIngredient[]; // Quantités par couvert, fournies par le backend
    instructions: string;
    prepTime: number;
    cookingTime?: number; // Optionnel car peut ne pas être présent dans toutes les sources